@@ -0,0 +1,76 @@
+from typing import List
+from src.application.notion.dto import NotificationMessage
+from src.infrastructure.config.constants import (
+    DISCORD_MESSAGE_LIMIT,
+    MESSAGE_TEMPLATES,
+    NOTIFICATION_DIGEST_THRESHOLD,
+)
+
+
+class NotificationCoalescer:
+    """Pack a cycle's notifications into as few Discord messages as possible
+
+    Notifications are joined into messages of at most ``max_length``
+    characters. Past ``threshold`` notifications the rest are folded into a
+    single "N more updates" line.
+    """
+
+    def __init__(
+        self,
+        max_length: int = DISCORD_MESSAGE_LIMIT,
+        threshold: int = NOTIFICATION_DIGEST_THRESHOLD,
+    ):
+        self.max_length = max_length
+        self.threshold = threshold
+
+    def format(self, notification: NotificationMessage) -> str:
+        """Format a single notification"""
+        return f"**{notification.title}**\n{notification.content}"
+
+    def pack(self, notifications: List[NotificationMessage]) -> List[str]:
+        """Build the messages for one cycle's notifications"""
+        blocks = [self.format(n) for n in notifications[: self.threshold]]
+        remaining = len(notifications) - len(blocks)
+        if remaining > 0:
+            blocks.append(MESSAGE_TEMPLATES["more_updates"].format(remaining))
+
+        messages = []
+        current = ""
+        for block in blocks:
+            for part in self._split(block):
+                if current and len(current) + 2 + len(part) <= self.max_length:
+                    current = f"{current}\n\n{part}"
+                else:
+                    if current:
+                        messages.append(current)
+                    current = part
+        if current:
+            messages.append(current)
+
+        return messages
+
+    def _split(self, block: str) -> List[str]:
+        """Split a block longer than one message at line boundaries"""
+        if len(block) <= self.max_length:
+            return [block]
+
+        parts = []
+        current = ""
+        for line in block.split("\n"):
+            while len(line) > self.max_length:
+                if current:
+                    parts.append(current)
+                    current = ""
+                parts.append(line[: self.max_length])
+                line = line[self.max_length :]
+
+            if current and len(current) + 1 + len(line) <= self.max_length:
+                current = f"{current}\n{line}"
+            else:
+                if current:
+                    parts.append(current)
+                current = line
+        if current:
+            parts.append(current)
+
+        return parts
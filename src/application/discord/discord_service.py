@@ -1,11 +1,16 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 import discord
 from discord.ext import commands, tasks
+from src.application.discord.coalescer import NotificationCoalescer
+from src.application.discord.dispatcher import NotificationDispatcher
+from src.application.notion.coordinator import LeaseCoordinator
 from src.application.notion.notion_service import NotionService
 from src.application.notion.dto import NotificationMessage
+from src.infrastructure.config.constants import WEEKLY_UPDATE_INTERVAL
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.notion_webhook.server import NotionWebhookEvent
 from src.utils.logging import logger
 
 
@@ -16,15 +21,27 @@ class DiscordService:
         settings: Settings,
         client: discord.Client = None,
         check_interval: int = 120,
+        coordinator: Optional[LeaseCoordinator] = None,
     ):
         self.notion_service = notion_service
+        self.coordinator = coordinator or LeaseCoordinator(
+            notion_service.notion_repository, notion_service.databases
+        )
         self.settings = settings
         self.client = client
         self.connected_channels: List[int] = []
         self._start_time = datetime.now(timezone.utc)
-        self._last_heartbeat = datetime.utcnow()
+        self._last_heartbeat = datetime.now(timezone.utc)
         self._db_lock = asyncio.Lock()
+        # Set once cooldowns and users are loaded, before any loop may sync
+        self.initialized = asyncio.Event()
         self.check_interval = check_interval
+        self._event_pages: Set[str] = set()
+        self._deleted_pages: Set[str] = set()
+        self.dispatcher = NotificationDispatcher(self._deliver)
+        self.coalescer = NotificationCoalescer(
+            threshold=settings.NOTIFICATION_DIGEST_THRESHOLD
+        )
 
     def _setup_periodic_tasks(self):
         """This method should be removed as task scheduling is handled by DiscordClient"""
@@ -47,49 +64,106 @@ class DiscordService:
                 self.register_channel(channel_id)
                 logger.info(f"Pre-registered channel: {channel_id}")
 
+            await self.notion_service.initialize()
+            self.initialized.set()
+
             logger.info("Discord service initialization completed")
         except Exception as e:
             logger.error(f"Error during initialization: {e}", exc_info=True)
             raise
 
-    async def handle_creation_notifications(self) -> List[NotificationMessage]:
-        """Handle notifications for newly created documents"""
+    async def renew_leases(self) -> None:
+        """Renew coordination leases, reloading cooldowns for newly owned work"""
+        acquired = await self.coordinator.renew()
+        if acquired:
+            # Another replica may have notified these databases meanwhile
+            await self.notion_service.cooldowns.load()
+
+    async def handle_sync_notifications(self) -> List[NotificationMessage]:
+        """Handle notifications for created and updated documents"""
         try:
+            now = datetime.now(timezone.utc)
+            databases = [
+                database
+                for database in self.notion_service.get_due_databases(now)
+                if self.coordinator.owns(database)
+            ]
             async with self._db_lock:
-                return await self.notion_service.handle_creations()
+                return await self.notion_service.handle_sync(
+                    databases, owns=self.coordinator.owns
+                )
         except Exception as e:
-            logger.error(f"Error handling creation notifications: {e}")
+            logger.error(f"Error handling sync notifications: {e}")
+            return []
+
+    def record_webhook_event(self, event: NotionWebhookEvent) -> None:
+        """Remember a page reported by a webhook until the next flush"""
+        if event.is_deletion:
+            self._deleted_pages.add(event.page_id)
+        else:
+            self._event_pages.add(event.page_id)
+            self._deleted_pages.discard(event.page_id)
+
+    async def handle_webhook_notifications(self) -> List[NotificationMessage]:
+        """Sync the pages reported by webhooks since the last flush"""
+        if not self._event_pages and not self._deleted_pages:
             return []
 
-    async def handle_update_notifications(self) -> List[NotificationMessage]:
-        """Handle notifications for updated documents"""
+        page_ids, self._event_pages = self._event_pages, set()
+        deleted_page_ids, self._deleted_pages = self._deleted_pages, set()
+        owned = [
+            database
+            for database in self.notion_service.databases
+            if self.coordinator.owns(database)
+        ]
+        logger.info(
+            f"Syncing {len(page_ids)} changed and {len(deleted_page_ids)} deleted "
+            "pages from webhook events"
+        )
         try:
             async with self._db_lock:
-                return await self.notion_service.handle_updates()
+                return await self.notion_service.handle_page_events(
+                    page_ids,
+                    deleted_page_ids,
+                    databases=owned,
+                    owns=self.coordinator.owns,
+                )
         except Exception as e:
-            logger.error(f"Error handling update notifications: {e}")
+            logger.error(f"Error handling webhook notifications: {e}")
             return []
 
-    async def handle_aggregate_updates(self) -> Optional[NotificationMessage]:
+    def next_check_delay(self) -> float:
+        """Get the seconds until one of this replica's databases is due"""
+        owned = [
+            database
+            for database in self.notion_service.databases
+            if self.coordinator.owns(database)
+        ]
+        return self.notion_service.seconds_until_due(owned, datetime.now(timezone.utc))
+
+    async def handle_aggregate_updates(self) -> List[NotificationMessage]:
         """Handle weekly aggregate updates"""
         try:
+            if not self.coordinator.is_leader:
+                return []
+
             current_time = datetime.now(timezone.utc)
-            time_difference = current_time - self._start_time
+            start_time = await self.notion_service.get_digest_window_start()
 
-            if time_difference.days >= 7:
+            if current_time - start_time >= WEEKLY_UPDATE_INTERVAL:
                 async with self._db_lock:
-                    notification = await self.notion_service.handle_aggregate_updates(
-                        start_time=self._start_time
+                    notifications = await self.notion_service.handle_aggregate_updates(
+                        start_time=start_time
                     )
 
-                if notification:
-                    self._start_time = current_time
-                    return notification
+                if notifications:
+                    await self.notion_service.close_digest_window(current_time)
+                    return notifications
 
-            return None
+            return []
         except Exception as e:
             logger.error(f"Error handling aggregate updates: {e}")
-            return None
+            return []
 
     def format_notification(self, notification: NotificationMessage) -> str:
         """Format notification for Discord message"""
@@ -99,19 +173,14 @@ class DiscordService:
         """Start all notification tasks"""
         while True:
             try:
-                creation_notifications = await self.handle_creation_notifications()
-                for notification in creation_notifications:
+                sync_notifications = await self.handle_sync_notifications()
+                for notification in sync_notifications:
                     yield notification
 
-                update_notifications = await self.handle_update_notifications()
-                for notification in update_notifications:
+                for notification in await self.handle_aggregate_updates():
                     yield notification
 
-                aggregate_notification = await self.handle_aggregate_updates()
-                if aggregate_notification:
-                    yield aggregate_notification
-
-                self._last_heartbeat = datetime.utcnow()
+                self._last_heartbeat = datetime.now(timezone.utc)
 
                 await asyncio.sleep(self.settings.UPDATE_INTERVAL)
 
@@ -125,32 +194,51 @@ class DiscordService:
             "start_time": self._start_time.isoformat(),
             "last_heartbeat": self._last_heartbeat.isoformat(),
             "connected_channels": self.connected_channels,
-            "uptime": str(datetime.utcnow() - self._start_time),
+            "uptime": str(datetime.now(timezone.utc) - self._start_time),
+            "notion_requests": self.notion_service.notion_client.get_stats(),
+            "dispatch": self.dispatcher.get_stats(),
+            "poll_intervals": self.notion_service.get_poll_intervals(),
+            "coordination": {
+                "mode": self.coordinator.mode,
+                "holder": self.coordinator.holder,
+                "is_leader": self.coordinator.is_leader,
+                "databases": sorted(self.coordinator.owned),
+            },
         }
 
-    async def _send_notification(self, notification: NotificationMessage):
-        """Send a notification to all connected channels"""
-        logger.debug(
-            f"Attempting to send notification to channels: {self.connected_channels}"
-        )
+    def queue_notifications(self, notifications: List[NotificationMessage]) -> None:
+        """Coalesce a cycle's notifications and queue them for their channels"""
+        if not notifications:
+            return
+
+        logger.debug(f"Queueing notifications for channels: {self.connected_channels}")
         if not self.connected_channels:
             logger.warning("No channels registered to receive notifications")
             return
 
-        formatted_message = f"**{notification.title}**\n{notification.content}"
-
-        for channel_id in self.connected_channels:
-            channel = self.client.get_channel(channel_id)
-            if channel:
-                try:
-                    await channel.send(content=formatted_message)
-                    logger.info(
-                        f"Successfully sent notification to channel {channel_id}"
-                    )
-                except Exception as e:
-                    logger.error(f"Error sending message to channel {channel_id}: {e}")
-            else:
-                logger.warning(f"Could not find channel with ID: {channel_id}")
+        routes: Dict[Tuple[int, ...], List[NotificationMessage]] = {}
+        for notification in notifications:
+            routes.setdefault(tuple(notification.channels), []).append(notification)
+
+        for channels, routed in routes.items():
+            messages = self.coalescer.pack(routed)
+            logger.info(
+                f"Coalesced {len(routed)} notifications into {len(messages)} messages"
+            )
+
+            for channel_id in channels:
+                if channel_id not in self.connected_channels:
+                    logger.warning(f"Channel {channel_id} is not registered, skipping")
+                    continue
+                for message in messages:
+                    self.dispatcher.enqueue(channel_id, message)
+
+    async def _deliver(self, channel_id: int, content: str) -> None:
+        """Send a message to a channel, raising on failure"""
+        channel = self.client.get_channel(channel_id)
+        if not channel:
+            raise LookupError(f"Could not find channel with ID: {channel_id}")
+        await channel.send(content=content)
 
     async def send_message(self, channel_id: int, title: str, content: str):
         """Send a message to a specific channel"""
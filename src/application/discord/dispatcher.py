@@ -0,0 +1,191 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+import discord
+from src.infrastructure.config.constants import (
+    DEFAULT_RETRY_DELAY,
+    DISCORD_ROUTE_BURST,
+    DISCORD_ROUTE_RATE,
+    MAX_DISPATCH_QUEUE_SIZE,
+    MAX_RETRY_ATTEMPTS,
+    MAX_RETRY_DELAY,
+)
+from src.infrastructure.metrics.instruments import (
+    DISCORD_MESSAGES,
+    DISCORD_RETRIES,
+    NOTIFICATION_LATENCY_SECONDS,
+    PENDING_NOTIFICATIONS,
+    SYNC_PHASE_SECONDS,
+)
+from src.infrastructure.tracing.tracer import TRACER, Span
+from src.utils.logging import logger
+from src.utils.rate_limit import TokenBucket
+
+
+@dataclass
+class QueuedMessage:
+    """A message waiting for delivery to one channel"""
+
+    channel_id: int
+    content: str
+    enqueued_at: float
+    span: Optional[Span] = None
+
+
+class NotificationDispatcher:
+    """Deliver messages through per-channel queues and worker tasks
+
+    Enqueueing never blocks, so the next Notion poll can start while messages
+    are still going out. Each channel has its own worker and rate-limit
+    bucket, so a slow or throttled channel only delays itself.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[int, str], Awaitable[Any]],
+        max_queue_size: int = MAX_DISPATCH_QUEUE_SIZE,
+        max_attempts: int = MAX_RETRY_ATTEMPTS,
+        route_rate: float = DISCORD_ROUTE_RATE,
+        route_burst: int = DISCORD_ROUTE_BURST,
+    ):
+        self.deliver = deliver
+        self.max_queue_size = max_queue_size
+        self.max_attempts = max_attempts
+        self.route_rate = route_rate
+        self.route_burst = route_burst
+
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+        self._buckets: Dict[int, TokenBucket] = {}
+        self._stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "failed": 0,
+            "retries": 0,
+            "dropped": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+        PENDING_NOTIFICATIONS.set_function(
+            lambda: sum(queue.qsize() for queue in self._queues.values())
+        )
+
+    def enqueue(self, channel_id: int, content: str) -> bool:
+        """Queue a message for a channel, starting its worker if needed"""
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = asyncio.Queue(self.max_queue_size)
+            self._buckets[channel_id] = TokenBucket(self.route_rate, self.route_burst)
+
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(self._work(channel_id))
+
+        try:
+            queue.put_nowait(
+                QueuedMessage(
+                    channel_id, content, time.monotonic(), TRACER.current_span()
+                )
+            )
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            DISCORD_MESSAGES.inc(result="dropped")
+            logger.error(f"Dispatch queue for channel {channel_id} is full, dropping")
+            return False
+
+        self._stats["enqueued"] += 1
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued message has been handled"""
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+
+    async def close(self) -> None:
+        """Stop all channel workers"""
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._workers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery counters, queue depths and latency"""
+        sent = self._stats["sent"]
+        return {
+            **self._stats,
+            "latency_avg": self._stats["latency_total"] / sent if sent else 0.0,
+            "queue_depth": sum(queue.qsize() for queue in self._queues.values()),
+            "queue_depth_by_channel": {
+                channel_id: queue.qsize() for channel_id, queue in self._queues.items()
+            },
+        }
+
+    async def _work(self, channel_id: int) -> None:
+        """Deliver a channel's queued messages in order"""
+        queue = self._queues[channel_id]
+        while True:
+            message = await queue.get()
+            try:
+                await self._send(message)
+            except Exception as e:
+                logger.error(f"Unexpected error in dispatcher for {channel_id}: {e}")
+            finally:
+                queue.task_done()
+
+    async def _send(self, message: QueuedMessage) -> None:
+        """Send one message, retrying failures that may succeed later"""
+        bucket = self._buckets[message.channel_id]
+        for attempt in range(1, self.max_attempts + 1):
+            await bucket.acquire()
+            try:
+                # Sends run after their cycle, so they join its trace explicitly
+                with SYNC_PHASE_SECONDS.time(phase="discord_send"), TRACER.span(
+                    "discord.send",
+                    parent=message.span,
+                    channel_id=message.channel_id,
+                    attempt=attempt,
+                ):
+                    await self.deliver(message.channel_id, message.content)
+            except Exception as e:
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after:
+                    bucket.pause(retry_after)
+
+                if not self._is_retryable(e) or attempt >= self.max_attempts:
+                    self._stats["failed"] += 1
+                    DISCORD_MESSAGES.inc(result="failed")
+                    logger.error(
+                        f"Error sending message to channel {message.channel_id}: {e}"
+                    )
+                    return
+
+                self._stats["retries"] += 1
+                DISCORD_RETRIES.inc()
+                if not retry_after:
+                    await asyncio.sleep(
+                        random.uniform(
+                            0,
+                            min(MAX_RETRY_DELAY, DEFAULT_RETRY_DELAY * 2**attempt),
+                        )
+                    )
+                continue
+
+            latency = time.monotonic() - message.enqueued_at
+            self._stats["sent"] += 1
+            self._stats["latency_total"] += latency
+            self._stats["latency_max"] = max(self._stats["latency_max"], latency)
+            DISCORD_MESSAGES.inc(result="sent")
+            NOTIFICATION_LATENCY_SECONDS.observe(latency)
+            logger.info(
+                f"Successfully sent notification to channel {message.channel_id}"
+            )
+            return
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Check whether a failed send may succeed if repeated"""
+        if isinstance(error, (discord.Forbidden, discord.NotFound, LookupError)):
+            return False
+        if isinstance(error, discord.HTTPException):
+            return error.status == 429 or error.status >= 500
+        return isinstance(error, (OSError, asyncio.TimeoutError))
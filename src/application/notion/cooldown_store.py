@@ -0,0 +1,74 @@
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Tuple
+from src.domain.notion.repositories import AsyncNotionRepository
+from src.utils.logging import logger
+
+
+class CooldownStore:
+    """Track when each document last notified, forgetting expired entries
+
+    Entries live in a dict of POSIX timestamps with a min-heap of expiry
+    times, so memory is bounded by the documents notified within one
+    cooldown window. State is persisted to ``notion_update_cooldowns`` and
+    reloaded with a single query at startup.
+    """
+
+    def __init__(self, notion_repository: AsyncNotionRepository, cooldown: int):
+        self.notion_repository = notion_repository
+        self.cooldown = cooldown
+        self._notified_at: Dict[str, float] = {}
+        self._expiries: List[Tuple[float, str]] = []
+
+    async def load(self) -> None:
+        """Load cooldowns that are still active from the database"""
+        now = datetime.now(timezone.utc)
+        try:
+            stored = await self.notion_repository.get_update_cooldowns(
+                now - timedelta(seconds=self.cooldown)
+            )
+        except Exception as e:
+            logger.warning(f"Could not load update cooldowns: {e}")
+            return
+
+        for document_id, notified_at in stored.items():
+            self._remember(document_id, notified_at.timestamp())
+        logger.info(f"Loaded {len(stored)} active update cooldowns")
+
+    def is_active(self, document_id: str, now: datetime) -> bool:
+        """Check whether a document notified less than ``cooldown`` seconds ago"""
+        self._expire(now.timestamp())
+        notified_at = self._notified_at.get(document_id)
+        return notified_at is not None and (
+            now.timestamp() - notified_at < self.cooldown
+        )
+
+    async def mark(self, document_ids: Iterable[str], now: datetime) -> None:
+        """Start the cooldown for documents that were just notified"""
+        document_ids = list(document_ids)
+        for document_id in document_ids:
+            self._remember(document_id, now.timestamp())
+
+        try:
+            await self.notion_repository.save_update_cooldowns(
+                {document_id: now for document_id in document_ids},
+                now - timedelta(seconds=self.cooldown),
+            )
+        except Exception as e:
+            logger.warning(f"Could not persist update cooldowns: {e}")
+
+    def __len__(self) -> int:
+        return len(self._notified_at)
+
+    def _remember(self, document_id: str, notified_at: float) -> None:
+        self._notified_at[document_id] = notified_at
+        heapq.heappush(self._expiries, (notified_at + self.cooldown, document_id))
+
+    def _expire(self, now: float) -> None:
+        """Drop entries whose cooldown has passed"""
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, document_id = heapq.heappop(self._expiries)
+            notified_at = self._notified_at.get(document_id)
+            # A newer notification pushed a later expiry onto the heap
+            if notified_at is not None and notified_at + self.cooldown <= expires_at:
+                del self._notified_at[document_id]
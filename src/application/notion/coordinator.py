@@ -0,0 +1,153 @@
+import math
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+from src.domain.notion.repositories import AsyncNotionRepository
+from src.infrastructure.config.constants import (
+    COORDINATION_LEADER,
+    COORDINATION_NONE,
+    COORDINATION_SHARD,
+    LEADER_LEASE,
+    LEASE_TTL,
+)
+from src.infrastructure.config.settings import WatchedDatabase
+from src.utils.logging import logger
+
+
+class LeaseCoordinator:
+    """Share polling work between bot replicas through lease rows
+
+    In ``leader`` mode one replica holds the leader lease and polls every
+    database. In ``shard`` mode each replica also keeps a heartbeat lease and
+    claims up to its fair share of per-database leases, releasing surplus
+    ones when another replica joins. The weekly summary always runs on the
+    leader. A crashed holder's leases expire after ``lease_ttl`` seconds and
+    are picked up on the next renewal, so ``renew`` should run several times
+    per lease interval. Ownership lapses with the last successful renewal,
+    so a sync pass that outlasts its lease finds it gone before notifying.
+    """
+
+    def __init__(
+        self,
+        notion_repository: AsyncNotionRepository,
+        databases: List[WatchedDatabase],
+        mode: str = COORDINATION_NONE,
+        lease_ttl: int = LEASE_TTL,
+        holder: Optional[str] = None,
+    ):
+        if mode not in (COORDINATION_NONE, COORDINATION_LEADER, COORDINATION_SHARD):
+            raise ValueError(f"Unknown coordination mode: {mode}")
+
+        self.notion_repository = notion_repository
+        self.databases = sorted(databases, key=lambda db: db.database_id)
+        self.mode = mode
+        self.lease_ttl = lease_ttl
+        self.holder = (
+            holder or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.is_leader = mode == COORDINATION_NONE
+        self.owned: Set[str] = (
+            {db.database_id for db in databases} if mode == COORDINATION_NONE else set()
+        )
+        self.renewed_at: Optional[datetime] = None
+
+    def owns(self, database: WatchedDatabase, now: Optional[datetime] = None) -> bool:
+        """Check whether this replica should poll a database"""
+        if database.database_id not in self.owned:
+            return False
+        if self.mode == COORDINATION_NONE:
+            return True
+        # Past the TTL another replica may already hold the lease
+        now = now or datetime.now(timezone.utc)
+        return now - self.renewed_at < timedelta(seconds=self.lease_ttl)
+
+    async def renew(self, now: Optional[datetime] = None) -> Set[str]:
+        """Renew and claim leases, returning the database IDs newly acquired"""
+        if self.mode == COORDINATION_NONE:
+            return set()
+
+        now = now or datetime.now(timezone.utc)
+        try:
+            self.is_leader = await self.notion_repository.acquire_lease(
+                LEADER_LEASE, self.holder, self.lease_ttl, now
+            )
+            if self.mode == COORDINATION_LEADER:
+                owned = (
+                    {db.database_id for db in self.databases}
+                    if self.is_leader
+                    else set()
+                )
+            else:
+                owned = await self._claim_shards(now)
+            self.renewed_at = now
+        except Exception as e:
+            # Leases lapse on their own, so stop polling rather than risk doubles
+            logger.error(f"Could not renew leases for {self.holder}: {e}")
+            self.is_leader = False
+            owned = set()
+
+        acquired = owned - self.owned
+        if owned != self.owned:
+            logger.info(
+                f"Replica {self.holder} now polls {len(owned)} databases"
+                f"{' as leader' if self.is_leader else ''}"
+            )
+        self.owned = owned
+        return acquired
+
+    async def _claim_shards(self, now: datetime) -> Set[str]:
+        """Keep or claim up to a fair share of the database leases"""
+        await self.notion_repository.acquire_lease(
+            self._replica_lease(), self.holder, self.lease_ttl, now
+        )
+        if self.is_leader:
+            await self.notion_repository.delete_expired_leases(now)
+        holders = await self.notion_repository.get_lease_holders(now)
+        replicas = sum(1 for name in holders if name.startswith("replica:"))
+        share = math.ceil(len(self.databases) / max(replicas, 1))
+
+        # Databases already held come first so ownership stays put
+        candidates = sorted(
+            self.databases,
+            key=lambda db: holders.get(self._database_lease(db)) != self.holder,
+        )
+        owned = set()
+        for database in candidates:
+            name = self._database_lease(database)
+            holder = holders.get(name)
+            if holder not in (None, self.holder):
+                continue
+            if len(owned) >= share:
+                if holder == self.holder:
+                    await self.notion_repository.release_lease(name, self.holder)
+                continue
+            if await self.notion_repository.acquire_lease(
+                name, self.holder, self.lease_ttl, now
+            ):
+                owned.add(database.database_id)
+        return owned
+
+    async def release(self) -> None:
+        """Give up every lease so another replica can take over immediately"""
+        if self.mode == COORDINATION_NONE:
+            return
+
+        names = [LEADER_LEASE]
+        if self.mode == COORDINATION_SHARD:
+            names.append(self._replica_lease())
+            names.extend(self._database_lease(db) for db in self.databases)
+        try:
+            for name in names:
+                await self.notion_repository.release_lease(name, self.holder)
+        except Exception as e:
+            logger.warning(f"Could not release leases for {self.holder}: {e}")
+        self.is_leader = False
+        self.owned = set()
+
+    def _replica_lease(self) -> str:
+        return f"replica:{self.holder}"
+
+    def _database_lease(self, database: WatchedDatabase) -> str:
+        return f"database:{database.database_id}"
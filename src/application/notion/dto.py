@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
+from src.domain.notion.entities import NotionDocument
 
 
 @dataclass
@@ -22,3 +23,22 @@ class NotificationMessage:
     content: str
     timestamp: datetime
     channels: List[int]
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a single sync pass over changed Notion pages"""
+
+    created: List[NotionDocument] = field(default_factory=list)
+    updated: List[NotionDocument] = field(default_factory=list)
+    unchanged: int = 0
+    deferred: int = 0
+    baseline: int = 0
+
+    def merge(self, other: "SyncResult") -> None:
+        """Add the outcome of another batch of the same pass"""
+        self.created.extend(other.created)
+        self.updated.extend(other.updated)
+        self.unchanged += other.unchanged
+        self.deferred += other.deferred
+        self.baseline += other.baseline
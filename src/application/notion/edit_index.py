@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Dict, Iterable
+from src.domain.notion.entities import NotionDocument
+from src.infrastructure.config.constants import NOTION_TIME_PRECISION
+from src.utils.notion_utils import format_notion_time
+
+
+class EditIndex:
+    """Raw ``last_edited_time`` of the pages stored exactly as Notion has them
+
+    Query results whose ID and edit time match an entry can skip parsing and
+    change detection. Notion rounds edit times down to the minute, so a
+    matching time only proves a page unchanged if its stored copy was taken
+    after that minute ended: pages are recorded only then, once a sync pass
+    has stored them or found them unchanged.
+    """
+
+    def __init__(self):
+        self.edits: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.edits)
+
+    def record(self, documents: Iterable[NotionDocument], fetched_at: datetime) -> None:
+        """Remember pages stored or confirmed by a pass that began at ``fetched_at``"""
+        settled_before = fetched_at - NOTION_TIME_PRECISION
+        for doc in documents:
+            if doc.last_edited_time <= settled_before:
+                self.edits[doc.id] = format_notion_time(doc.last_edited_time)
+            else:
+                self.edits.pop(doc.id, None)
+
+    def prune(self, before: datetime) -> None:
+        """Forget pages edited before ``before``, which queries no longer return"""
+        # The fixed-width UTC format sorts in time order
+        cutoff = format_notion_time(before)
+        self.edits = {
+            page_id: edited
+            for page_id, edited in self.edits.items()
+            if edited >= cutoff
+        }
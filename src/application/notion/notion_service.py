@@ -1,167 +1,441 @@
+import asyncio
+import time
+from contextlib import aclosing
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.application.discord.discord_service import DiscordService
 
-from src.domain.notion.entities import NotionDocument
-from src.domain.notion.repositories import NotionRepository
+from src.domain.notion.entities import DocumentActivity, NotionDocument
+from src.domain.notion.repositories import AsyncNotionRepository
+from src.infrastructure.config.settings import WatchedDatabase
+from src.infrastructure.metrics.instruments import (
+    CHANGE_DETECTION_SECONDS,
+    LAST_SUCCESSFUL_SYNC,
+    PAGES_SKIPPED,
+    SYNC_PHASE_SECONDS,
+)
 from src.infrastructure.notion_client.client import NotionClient
-from .dto import NotificationMessage
+from src.infrastructure.tracing.tracer import TRACER
+from .dto import NotificationMessage, SyncResult
+from .cooldown_store import CooldownStore
+from .edit_index import EditIndex
+from .poll_interval import AdaptivePollInterval
+from .user_directory import UserDirectory
 from src.utils.logging import logger
-from src.infrastructure.config.constants import MESSAGE_TEMPLATES
+from src.utils.notion_utils import normalize_notion_id
+from src.infrastructure.config.constants import (
+    MESSAGE_TEMPLATES,
+    SYNC_TYPE_UPDATES,
+    SYNC_TYPE_WEEKLY_SUMMARY,
+)
 
 
 class NotionService:
     def __init__(
         self,
         notion_client: NotionClient,
-        notion_repository: NotionRepository,
+        notion_repository: AsyncNotionRepository,
         notification_channels: List[int],
         update_cooldown: int = 14400,  # 4 hours default
+        user_directory: Optional[UserDirectory] = None,
+        databases: Optional[List[WatchedDatabase]] = None,
     ):
         self.notion_client = notion_client
         self.notion_repository = notion_repository
-        self.notification_channels = notification_channels
-        self._last_update_times = {}
+        self.user_directory = user_directory or UserDirectory(
+            notion_client, notion_repository
+        )
+        self.databases = databases or [
+            WatchedDatabase(
+                database_id=normalize_notion_id(notion_client.database_id),
+                channels=notification_channels,
+            )
+        ]
+        self.notification_channels = list(
+            dict.fromkeys(
+                channel for database in self.databases for channel in database.channels
+            )
+        )
         self.update_cooldown = update_cooldown
+        self.cooldowns = CooldownStore(notion_repository, update_cooldown)
+        self.poll_intervals = {
+            database.database_id: AdaptivePollInterval(
+                database.min_interval, database.max_interval
+            )
+            for database in self.databases
+        }
+        self.edit_indexes = {
+            database.database_id: EditIndex() for database in self.databases
+        }
+        self._next_poll: Dict[str, datetime] = {}
+
+    async def initialize(self) -> None:
+        """Warm caches before the first sync pass"""
+        await self.cooldowns.load()
+        await self.user_directory.warm()
 
     async def _get_user_safely(self, user_id: str) -> str:
         """Safely get user information with fallback"""
         try:
-            user = await self.notion_client.get_user(user_id)
-            return user
+            return await self.user_directory.get_name(user_id)
         except Exception as e:
             logger.warning(f"Could not fetch user info for {user_id}: {e}")
             return "Unknown User"
 
-    async def handle_creations(self) -> List[NotificationMessage]:
-        """Handle notifications for newly created documents"""
+    async def _get_users_safely(self, user_ids: Iterable[str]) -> Dict[str, str]:
+        """Resolve many users concurrently, falling back to an empty mapping"""
         try:
-            documents = await self.notion_client.get_recent_documents()
-            notifications = []
+            return await self.user_directory.get_names(user_ids)
+        except Exception as e:
+            logger.warning(f"Could not fetch user info: {e}")
+            return {}
 
-            for doc in documents:
-                existing_doc = self.notion_repository.get_document(doc.id)
-                if not existing_doc:
-                    title = (
-                        doc.title[0]["plain_text"]
-                        if isinstance(doc.title, list)
-                        else doc.title
-                    )
-                    doc.title = title  # Update the document title
+    def _has_changes(
+        self, doc: NotionDocument, stored: Tuple[datetime, Optional[str]]
+    ) -> bool:
+        """Check a fetched page against its stored (last_edited_time, hash)"""
+        last_edited_time, content_hash = stored
+        if doc.last_edited_time > last_edited_time:
+            return True
+        # Rows stored before content hashes existed compare on time alone
+        return content_hash is not None and doc.content_hash != content_hash
 
-                    logger.info(f"Saving new document to database: {title}")
-                    self.notion_repository.save_document(doc)
+    def _watermark_type(self, database: WatchedDatabase) -> str:
+        """Sync type under which a database's high-water mark is stored"""
+        return f"{SYNC_TYPE_UPDATES}:{database.database_id}"
 
-                    created_by = await self._get_user_safely(doc.created_by.id)
-                    logger.info(f"Creating notification for new document: {title}")
+    def get_due_databases(self, now: datetime) -> List[WatchedDatabase]:
+        """Get the databases whose poll interval has elapsed"""
+        return [
+            database
+            for database in self.databases
+            if self._next_poll.get(database.database_id, now) <= now
+        ]
 
-                    notifications.append(
-                        NotificationMessage(
-                            title=MESSAGE_TEMPLATES["creation"].format(doc.title),
-                            content=self._format_creation_message(doc, created_by),
-                            timestamp=doc.created_time,
-                            channels=self.notification_channels,
-                        )
-                    )
+    def seconds_until_due(
+        self, databases: Iterable[WatchedDatabase], now: datetime
+    ) -> float:
+        """Get the time until the earliest of ``databases`` is due for a poll"""
+        next_polls = [
+            self._next_poll.get(database.database_id, now) for database in databases
+        ]
+        if not next_polls:
+            return min(database.min_interval for database in self.databases)
+        return max((min(next_polls) - now).total_seconds(), 0)
 
-            return notifications
-        except Exception as e:
-            logger.error(f"Error handling creations: {e}")
-            return []
+    def get_poll_intervals(self) -> Dict[str, float]:
+        """Get the current poll interval of each database in seconds"""
+        return {
+            database_id: interval.current
+            for database_id, interval in self.poll_intervals.items()
+        }
 
-    async def handle_updates(self) -> List[NotificationMessage]:
-        """Handle notifications for updated documents"""
-        try:
-            documents = await self.notion_client.get_updated_documents()
-            logger.info(f"Processing {len(documents)} potential updates")
-            notifications = []
-            current_time = datetime.now(timezone.utc)
+    def _schedule_next_poll(self, database: WatchedDatabase, changed: bool) -> None:
+        """Adapt a database's poll interval to the last cycle and schedule it"""
+        interval = self.poll_intervals[database.database_id]
+        previous = interval.current
+        current = interval.record(changed)
+        if current != previous:
+            logger.info(
+                f"Poll interval for {database.database_id} is now {current:.0f}s"
+            )
+        self._next_poll[database.database_id] = datetime.now(timezone.utc) + timedelta(
+            seconds=current
+        )
 
-            for doc in documents:
-                title = (
-                    doc.title[0]["plain_text"]
-                    if isinstance(doc.title, list)
-                    else doc.title
-                )
-                doc.title = title
-
-                if doc.id in self._last_update_times:
-                    last_update = self._last_update_times[doc.id]
-                    time_since_last_update = (
-                        current_time - last_update
-                    ).total_seconds()
-                    if time_since_last_update < self.update_cooldown:
-                        logger.debug(f"Skipping update for {title} due to cooldown")
+    async def sync_documents(self, database: WatchedDatabase) -> SyncResult:
+        """Fetch a database's changed pages once and sort them against the stored state
+
+        Each page of results is compared and saved while the next one is
+        fetched. Pages whose edit time is in the database's ``EditIndex`` are
+        counted as unchanged without being parsed. On the very first pass (no
+        watermark yet) unseen pages are stored as a silent baseline instead
+        of being reported as created. If the pass fails part way, the pages
+        already processed are kept but the watermark stays put, so the next
+        pass fetches the rest.
+        """
+        watermark_type = self._watermark_type(database)
+        watermark = await self.notion_repository.get_sync_watermark(watermark_type)
+        edit_index = self.edit_indexes[database.database_id]
+        result = SyncResult()
+        deferred_edit_times = []
+        newest = None
+
+        fetched_at = datetime.now(timezone.utc)
+        batches = self.notion_client.iter_updated_documents(
+            since=watermark,
+            database_id=database.database_id,
+            known_edits=edit_index.edits,
+        )
+        try:
+            async with aclosing(batches):
+                while True:
+                    with SYNC_PHASE_SECONDS.time(phase="notion_fetch"):
+                        batch = await anext(batches, None)
+                    if batch is None:
+                        break
+                    if newest is None or batch.newest_edit > newest[0]:
+                        newest = (batch.newest_edit, batch.newest_id)
+                    result.unchanged += batch.skipped
+                    PAGES_SKIPPED.inc(batch.skipped)
+                    if not batch.documents:
                         continue
 
-                existing_doc = self.notion_repository.get_document(doc.id)
-                if existing_doc:
-                    has_changes = (
-                        doc.title != existing_doc.title
-                        or doc.last_edited_time > existing_doc.last_edited_time
-                        or doc.properties != existing_doc.properties
+                    batch_result, deferred = await self._process_documents(
+                        batch.documents, baseline=watermark is None
                     )
+                    result.merge(batch_result)
+                    deferred_edit_times.extend(doc.last_edited_time for doc in deferred)
+                    deferred_ids = {doc.id for doc in deferred}
+                    edit_index.record(
+                        (doc for doc in batch.documents if doc.id not in deferred_ids),
+                        fetched_at,
+                    )
+        except Exception as e:
+            logger.error(f"Sync pass for {database.database_id} stopped early: {e}")
+        else:
+            new_watermark = await self._advance_watermark(
+                watermark_type, watermark, newest, deferred_edit_times
+            )
+            if new_watermark:
+                edit_index.prune(new_watermark)
+            LAST_SUCCESSFUL_SYNC.set_to_current_time(database_id=database.database_id)
 
-                    if has_changes:
-                        logger.info(f"Update detected for document: {title}")
-                        edited_by = await self._get_user_safely(doc.last_edited_by.id)
-                        self.notion_repository.save_document(doc)
+        logger.info(
+            f"Sync pass for {database.database_id}: {len(result.created)} created, "
+            f"{len(result.updated)} updated, {result.unchanged} unchanged, "
+            f"{result.deferred} deferred, {result.baseline} baseline"
+        )
+        return result
 
-                        self._last_update_times[doc.id] = current_time
+    async def _process_documents(
+        self, documents: List[NotionDocument], baseline: bool
+    ) -> Tuple[SyncResult, List[NotionDocument]]:
+        """Sort fetched pages against the stored state and save the changes
 
-                        notifications.append(
-                            NotificationMessage(
-                                title=MESSAGE_TEMPLATES["update"].format(doc.title),
-                                content=self._format_update_message(doc, edited_by),
-                                timestamp=doc.last_edited_time,
-                                channels=self.notification_channels,
-                            )
-                        )
+        Returns the result and the pages held back by the update cooldown. With
+        ``baseline`` set, unseen pages are stored without being reported as
+        created.
+        """
+        result = SyncResult()
+        current_time = datetime.now(timezone.utc)
+        deferred = []
+        changed_docs = []
 
-            logger.info(f"Created {len(notifications)} update notifications")
-            return notifications
+        compare_started = time.perf_counter()
+        change_index = await self.notion_repository.get_change_index(
+            doc.id for doc in documents
+        )
+
+        for doc in documents:
+            stored = change_index.get(doc.id)
+            if not stored:
+                logger.info(f"Saving new document to database: {doc.title}")
+                changed_docs.append(doc)
+                if baseline:
+                    result.baseline += 1
+                else:
+                    result.created.append(doc)
+            elif not self._has_changes(doc, stored):
+                result.unchanged += 1
+            elif self.cooldowns.is_active(doc.id, current_time):
+                logger.debug(f"Skipping update for {doc.title} due to cooldown")
+                deferred.append(doc)
+                result.deferred += 1
+            else:
+                logger.info(f"Update detected for document: {doc.title}")
+                changed_docs.append(doc)
+                result.updated.append(doc)
+
+        SYNC_PHASE_SECONDS.observe(
+            time.perf_counter() - compare_started, phase="db_compare"
+        )
+        for doc in result.created + result.updated:
+            CHANGE_DETECTION_SECONDS.observe(
+                (current_time - doc.last_edited_time).total_seconds()
+            )
+
+        with SYNC_PHASE_SECONDS.time(phase="db_write"):
+            await self.notion_repository.save_documents_bulk(changed_docs)
+            if result.updated:
+                await self.cooldowns.mark(
+                    (doc.id for doc in result.updated), current_time
+                )
+        return result, deferred
+
+    async def handle_sync(
+        self,
+        databases: Optional[List[WatchedDatabase]] = None,
+        owns: Optional[Callable[[WatchedDatabase], bool]] = None,
+    ) -> List[NotificationMessage]:
+        """Sync the due databases concurrently and collect their notifications
+
+        All databases share the client's request scheduler, so concurrent
+        polls stay within one Notion rate limit. Each database's next poll is
+        then scheduled from its adaptive interval. When ``owns`` is given, a
+        database no longer owned once its pass ends is not announced.
+        """
+        if databases is None:
+            databases = self.get_due_databases(datetime.now(timezone.utc))
+
+        results = await asyncio.gather(
+            *(self._handle_database_sync(database, owns) for database in databases)
+        )
+        for database, notifications in zip(databases, results):
+            self._schedule_next_poll(database, changed=bool(notifications))
+        return [notification for batch in results for notification in batch]
+
+    async def _handle_database_sync(
+        self,
+        database: WatchedDatabase,
+        owns: Optional[Callable[[WatchedDatabase], bool]] = None,
+    ) -> List[NotificationMessage]:
+        """Run one sync pass over a database and build its notifications"""
+        try:
+            with TRACER.span("sync_database", database_id=database.database_id):
+                result = await self.sync_documents(database)
+                if not self._still_owned(database, owns):
+                    return []
+                return await self._build_notifications(database, result)
         except Exception as e:
-            logger.error(f"Error handling updates: {e}")
+            logger.error(f"Error handling sync for {database.database_id}: {e}")
             return []
 
-    async def _process_document_update(
-        self, doc: NotionDocument, current_time: datetime
-    ) -> Optional[NotificationMessage]:
-        """Process a single document update"""
+    async def handle_page_events(
+        self,
+        page_ids: Iterable[str],
+        deleted_page_ids: Iterable[str] = (),
+        databases: Optional[List[WatchedDatabase]] = None,
+        owns: Optional[Callable[[WatchedDatabase], bool]] = None,
+    ) -> List[NotificationMessage]:
+        """Sync individual pages reported by webhook events
+
+        Only the affected pages are fetched, and only those belonging to
+        ``databases`` (all watched databases by default) are processed.
+        Deleted pages are stored with their archived state but not announced,
+        and neither are databases ``owns`` rejects once the pages are saved.
+        The database watermarks are left to the reconciliation poll.
+        """
+        watched = {
+            database.database_id: database for database in databases or self.databases
+        }
+        page_ids = set(page_ids)
+        deleted_page_ids = set(deleted_page_ids) - page_ids
         try:
-            if doc.id in self._last_update_times:
-                last_update = self._last_update_times[doc.id]
-                if (current_time - last_update).total_seconds() < 900:
-                    return None
-
-            self._last_update_times[doc.id] = current_time
-            last_known_update = self.notion_repository.get_last_update_time(doc.id)
-
-            if not last_known_update or doc.last_edited_time > last_known_update:
-                title = (
-                    doc.title[0]["plain_text"]
-                    if isinstance(doc.title, list)
-                    else doc.title
+            with SYNC_PHASE_SECONDS.time(phase="notion_fetch"):
+                fetched = await asyncio.gather(
+                    *(
+                        self.notion_client.get_document(page_id)
+                        for page_id in [*page_ids, *deleted_page_ids]
+                    )
                 )
-                doc.title = title
+            by_database: Dict[str, List[NotionDocument]] = {}
+            deleted = []
+            for doc in fetched:
+                if not doc or doc.database_id not in watched:
+                    continue
+                if doc.id in deleted_page_ids:
+                    deleted.append(doc)
+                else:
+                    by_database.setdefault(doc.database_id, []).append(doc)
 
-                logger.info(f"Saving updated document to database: {title}")
-                self.notion_repository.save_document(doc)
+            await self.notion_repository.save_documents_bulk(deleted)
 
-                edited_by = await self._get_user_safely(doc.last_edited_by.id)
+            notifications = []
+            for database_id, documents in by_database.items():
+                result, _ = await self._process_documents(documents, baseline=False)
+                if not self._still_owned(watched[database_id], owns):
+                    continue
+                notifications.extend(
+                    await self._build_notifications(watched[database_id], result)
+                )
+            return notifications
+        except Exception as e:
+            logger.error(f"Error handling page events: {e}")
+            return []
 
-                return NotificationMessage(
+    def _still_owned(
+        self,
+        database: WatchedDatabase,
+        owns: Optional[Callable[[WatchedDatabase], bool]],
+    ) -> bool:
+        """Check that no other replica took over a database during its pass"""
+        if owns is None or owns(database):
+            return True
+        logger.warning(
+            f"Lost the lease on {database.database_id} during its sync pass, "
+            "leaving its notifications to the new owner"
+        )
+        return False
+
+    async def _build_notifications(
+        self, database: WatchedDatabase, result: SyncResult
+    ) -> List[NotificationMessage]:
+        """Build creation and update notifications for a sync result"""
+        notifications = []
+
+        users = await self._get_users_safely(
+            [doc.created_by.id for doc in result.created]
+            + [doc.last_edited_by.id for doc in result.updated]
+        )
+
+        for doc in result.created:
+            created_by = users.get(doc.created_by.id, "Unknown User")
+            notifications.append(
+                NotificationMessage(
+                    title=MESSAGE_TEMPLATES["creation"].format(doc.title),
+                    content=self._format_creation_message(doc, created_by),
+                    timestamp=doc.created_time,
+                    channels=database.channels,
+                )
+            )
+
+        for doc in result.updated:
+            edited_by = users.get(doc.last_edited_by.id, "Unknown User")
+            notifications.append(
+                NotificationMessage(
                     title=MESSAGE_TEMPLATES["update"].format(doc.title),
                     content=self._format_update_message(doc, edited_by),
                     timestamp=doc.last_edited_time,
-                    channels=self.notification_channels,
+                    channels=database.channels,
                 )
-        except Exception as e:
-            logger.error(f"Error processing document update: {e}", exc_info=True)
+            )
+
+        logger.info(
+            f"Created {len(notifications)} notifications for {database.database_id}"
+        )
+        return notifications
+
+    async def _advance_watermark(
+        self,
+        watermark_type: str,
+        watermark: Optional[datetime],
+        newest: Optional[Tuple[datetime, str]],
+        deferred_edit_times: List[datetime],
+    ) -> Optional[datetime]:
+        """Move the update high-water mark forward after a processed cycle
+
+        ``newest`` is the edit time and ID of the most recently edited page of
+        the cycle. The mark never passes a page whose notification was
+        deferred by the cooldown, so that page is fetched again once the
+        cooldown expires. Returns the new mark if it moved.
+        """
+        if newest is None:
             return None
-        return None
+
+        newest_edit, newest_id = newest
+        new_watermark = newest_edit
+        if deferred_edit_times:
+            new_watermark = min(new_watermark, min(deferred_edit_times))
+
+        if watermark is not None and new_watermark <= watermark:
+            return None
+        await self.notion_repository.save_sync_watermark(
+            watermark_type, new_watermark, cursor=newest_id
+        )
+        return new_watermark
 
     def _format_update_message(self, doc: NotionDocument, edited_by: str) -> str:
         """Format update message for Discord"""
@@ -173,30 +447,85 @@ class NotionService:
         title = MESSAGE_TEMPLATES["creation"].format(doc.title)
         return f"{title}\n**Created By:** {created_by}\n**Time:** <t:{int(doc.created_time.timestamp())}:F>\n**Link:** {doc.url}"
 
+    async def get_digest_window_start(self) -> datetime:
+        """Get the start of the current weekly digest window
+
+        The start is persisted so restarts do not reset the window; the first
+        call opens a window at the current time.
+        """
+        start_time = await self.notion_repository.get_sync_watermark(
+            SYNC_TYPE_WEEKLY_SUMMARY
+        )
+        if start_time is None:
+            start_time = datetime.now(timezone.utc)
+            await self.notion_repository.save_sync_watermark(
+                SYNC_TYPE_WEEKLY_SUMMARY, start_time
+            )
+        return start_time
+
+    async def close_digest_window(self, end_time: datetime) -> None:
+        """Start the next weekly digest window at ``end_time``"""
+        await self.notion_repository.save_sync_watermark(
+            SYNC_TYPE_WEEKLY_SUMMARY, end_time
+        )
+
+    def _format_aggregate_message(
+        self, activity: List[DocumentActivity], names: Dict[str, str]
+    ) -> str:
+        """Format the weekly summary for Discord"""
+        lines = ["Weekly Update Summary:", ""]
+        for entry in activity:
+            editors = (
+                ", ".join(
+                    names.get(user.id) or user.name or "Unknown User"
+                    for user in entry.editors
+                )
+                or "Unknown User"
+            )
+            edits = "edit" if entry.edit_count == 1 else "edits"
+            lines.append(f"• {entry.title} - {entry.edit_count} {edits} by {editors}")
+        return "\n".join(lines)
+
     async def handle_aggregate_updates(
         self, start_time: datetime
+    ) -> List[NotificationMessage]:
+        """Build a weekly summary for each watched database"""
+        notifications = []
+        for database in self.databases:
+            notification = await self._handle_database_aggregate(database, start_time)
+            if notification:
+                notifications.append(notification)
+        return notifications
+
+    async def _handle_database_aggregate(
+        self, database: WatchedDatabase, start_time: datetime
     ) -> Optional[NotificationMessage]:
-        """Handle weekly aggregate updates"""
+        """Build the weekly summary for one database"""
         try:
-            updated_docs = self.notion_repository.get_documents_updated_since(
-                start_time
+            activity = await self.notion_repository.get_document_activity(
+                start_time, database_id=database.database_id
             )
-            if not updated_docs:
+            if not activity:
                 return None
 
-            content = "Weekly Update Summary:\n\n"
-            for doc in updated_docs:
-                edited_by = await self._get_user_safely(doc.last_edited_by.id)
-                content += f"• {doc.title} - Updated by {edited_by}\n"
+            # Stored names cover almost everyone; only unnamed editors hit the directory
+            names = await self._get_users_safely(
+                user.id
+                for entry in activity
+                for user in entry.editors
+                if not user.name or user.name == "Unknown User"
+            )
 
             return NotificationMessage(
                 title=MESSAGE_TEMPLATES["weekly_summary"],
-                content=content,
+                content=self._format_aggregate_message(activity, names),
                 timestamp=datetime.now(),
-                channels=self.notification_channels,
+                channels=database.channels,
             )
         except Exception as e:
-            logger.error(f"Error handling aggregate updates: {e}")
+            logger.error(
+                f"Error handling aggregate updates for {database.database_id}: {e}"
+            )
             return None
 
     async def _send_notification(self, notification: NotificationMessage):
@@ -0,0 +1,28 @@
+from src.infrastructure.config.constants import POLL_BACKOFF_FACTOR
+
+
+class AdaptivePollInterval:
+    """Poll interval that drops to the minimum on change and backs off when idle
+
+    Every cycle that found changes resets the interval to ``min_interval``;
+    each quiet cycle multiplies it by ``backoff`` up to ``max_interval``.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = POLL_BACKOFF_FACTOR,
+    ):
+        self.min_interval = float(min_interval)
+        self.max_interval = float(max_interval)
+        self.backoff = backoff
+        self.current = self.min_interval
+
+    def record(self, changed: bool) -> float:
+        """Update the interval after a poll and return the new value"""
+        if changed:
+            self.current = self.min_interval
+        else:
+            self.current = min(self.current * self.backoff, self.max_interval)
+        return self.current
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Dict, Iterable
+from src.domain.notion.repositories import AsyncNotionRepository
+from src.infrastructure.config.constants import (
+    USER_CACHE_MAX_SIZE,
+    USER_CACHE_TTL,
+    USER_NEGATIVE_CACHE_TTL,
+)
+from src.infrastructure.metrics.instruments import USER_CACHE_LOOKUPS
+from src.infrastructure.notion_client.client import NotionClient
+from src.utils.cache import TTLCache
+from src.utils.logging import logger
+
+UNKNOWN_USER = "Unknown User"
+
+
+class UserDirectory:
+    """Resolve Notion user IDs to display names
+
+    Names are held in an LRU cache with a TTL, persisted to ``notion_users``
+    and reloaded from there on startup. Failed lookups are cached under a
+    shorter TTL so they are retried without hammering the API.
+    """
+
+    def __init__(
+        self,
+        notion_client: NotionClient,
+        notion_repository: AsyncNotionRepository,
+        max_size: int = USER_CACHE_MAX_SIZE,
+        ttl: int = USER_CACHE_TTL,
+        negative_ttl: int = USER_NEGATIVE_CACHE_TTL,
+    ):
+        self.notion_client = notion_client
+        self.notion_repository = notion_repository
+        self.negative_ttl = negative_ttl
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def warm(self) -> None:
+        """Load known users from the database, then sweep the workspace
+
+        Only workspace users that are new or renamed since they were stored
+        are written back, in one bulk upsert.
+        """
+        stored_names: Dict[str, str] = {}
+        try:
+            stored_users = await self.notion_repository.get_users()
+            for user in stored_users:
+                stored_names[user.id] = user.name
+                if user.name and user.name != UNKNOWN_USER:
+                    self._cache.set(user.id, user.name)
+            logger.info(f"Loaded {len(self._cache)} users from the database")
+        except Exception as e:
+            logger.warning(f"Could not load users from the database: {e}")
+
+        try:
+            users = await self.notion_client.list_users()
+        except Exception as e:
+            logger.warning(f"Could not list Notion workspace users: {e}")
+            return
+
+        changed = []
+        for user in users:
+            row = _user_row(user)
+            self._cache.set(row["id"], row["name"])
+            if stored_names.get(row["id"]) != row["name"]:
+                changed.append(row)
+        try:
+            await self.notion_repository.save_users(changed)
+        except Exception as e:
+            logger.warning(f"Could not save {len(changed)} workspace users: {e}")
+        logger.info(
+            f"Warmed user directory with {len(users)} workspace users, "
+            f"{len(changed)} new or renamed"
+        )
+
+    async def get_name(self, user_id: str) -> str:
+        """Get the display name for a user ID"""
+        name = self._cache.get(user_id)
+        if name is not None:
+            USER_CACHE_LOOKUPS.inc(result="hit")
+            return name
+        USER_CACHE_LOOKUPS.inc(result="miss")
+
+        try:
+            user = await self.notion_client.get_user(user_id)
+        except Exception as e:
+            logger.debug(f"Could not fetch user {user_id}, using ID as name: {e}")
+            fallback = user_id[:8]
+            self._cache.set(user_id, fallback, ttl=self.negative_ttl)
+            return fallback
+
+        return await self._remember(user)
+
+    async def get_names(self, user_ids: Iterable[str]) -> Dict[str, str]:
+        """Resolve many user IDs concurrently, keyed by ID"""
+        unique_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+        names = await asyncio.gather(*(self.get_name(uid) for uid in unique_ids))
+        return dict(zip(unique_ids, names))
+
+    async def _remember(self, user: dict) -> str:
+        """Cache a resolved user and write it back to the database"""
+        row = _user_row(user)
+        self._cache.set(row["id"], row["name"])
+        try:
+            await self.notion_repository.save_user(row)
+        except Exception as e:
+            logger.warning(f"Could not save user {user['id']}: {e}")
+        return row["name"]
+
+
+def _user_row(user: dict) -> dict:
+    """Map a Notion API user to a ``notion_users`` row"""
+    return {
+        "id": user["id"],
+        "name": user.get("name") or UNKNOWN_USER,
+        "email": user.get("person", {}).get("email"),
+        "type": user.get("type", "person"),
+        "avatar_url": user.get("avatar_url"),
+    }
@@ -1,10 +1,22 @@
-from dataclasses import dataclass
+import json
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional
-from src.utils.notion_utils import extract_title
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+from src.infrastructure.config.constants import USER_CACHE_MAX_SIZE
+from src.utils.notion_utils import (
+    encode_properties,
+    extract_title,
+    hash_encoded_content,
+    normalize_notion_id,
+)
 
+# Frozen dataclasses set their fields through object.__setattr__
+_setattr = object.__setattr__
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class NotionUser:
     id: str
     name: Optional[str] = None
@@ -13,15 +25,34 @@ class NotionUser:
     @classmethod
     def from_api_response(cls, data: dict) -> "NotionUser":
         """Create a NotionUser from API response data"""
-        return cls(
-            id=data["id"],
-            name=data.get("name", "Unknown User"),
-            avatar_url=data.get("avatar_url"),
+        return _shared_user(
+            data["id"], data.get("name", "Unknown User"), data.get("avatar_url")
         )
 
 
-@dataclass
+@lru_cache(maxsize=USER_CACHE_MAX_SIZE)
+def _shared_user(
+    user_id: str, name: Optional[str], avatar_url: Optional[str]
+) -> NotionUser:
+    """Reuse one immutable user for the many pages that reference it"""
+    return NotionUser(id=sys.intern(user_id), name=name, avatar_url=avatar_url)
+
+
+@lru_cache(maxsize=1024)
+def _database_id(database_id: str) -> str:
+    """Normalize and intern a database ID shared by every page in it"""
+    return sys.intern(normalize_notion_id(database_id))
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class NotionDocument:
+    """Notion page with its properties held as JSON until something reads them
+
+    Pages parsed from the API keep ``properties`` as the canonical JSON used
+    for the content hash, which takes a fraction of the memory of the nested
+    dicts. Each read of ``properties`` decodes a fresh copy.
+    """
+
     id: str
     object: str
     created_time: datetime
@@ -29,16 +60,63 @@ class NotionDocument:
     created_by: NotionUser
     last_edited_by: NotionUser
     title: str
-    url: Optional[str] = None
-    archived: bool = False
-    properties: Dict = None
+    url: Optional[str]
+    archived: bool
+    content_hash: Optional[str]
+    database_id: Optional[str]
+    _properties: Union[bytes, Dict, None] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        id: str,
+        object: str,
+        created_time: datetime,
+        last_edited_time: datetime,
+        created_by: NotionUser,
+        last_edited_by: NotionUser,
+        title: str,
+        url: Optional[str] = None,
+        archived: bool = False,
+        properties: Union[bytes, Dict, None] = None,
+        content_hash: Optional[str] = None,
+        database_id: Optional[str] = None,
+    ):
+        _setattr(self, "id", id)
+        _setattr(self, "object", object)
+        _setattr(self, "created_time", created_time)
+        _setattr(self, "last_edited_time", last_edited_time)
+        _setattr(self, "created_by", created_by)
+        _setattr(self, "last_edited_by", last_edited_by)
+        _setattr(self, "title", title)
+        _setattr(self, "url", url)
+        _setattr(self, "archived", archived)
+        _setattr(self, "_properties", properties)
+        _setattr(self, "content_hash", content_hash)
+        _setattr(self, "database_id", database_id)
+
+    @property
+    def properties(self) -> Optional[Dict]:
+        """Get the page properties, decoding them if they are still JSON"""
+        if isinstance(self._properties, bytes):
+            return json.loads(self._properties)
+        return self._properties
 
     @classmethod
-    def from_api_response(cls, data: dict) -> "NotionDocument":
-        """Create a NotionDocument from API response data"""
+    def from_api_response(
+        cls, data: dict, database_id: Optional[str] = None
+    ) -> "NotionDocument":
+        """Create a NotionDocument from API response data
+
+        ``database_id`` overrides the page's parent, for pages queried from a
+        known database.
+        """
+        title = extract_title(data)
+        properties = encode_properties(data.get("properties", {}))
+        archived = data.get("archived", False)
+        database_id = database_id or data.get("parent", {}).get("database_id")
         return cls(
             id=data["id"],
-            object=data["object"],
+            object=sys.intern(data["object"]),
             created_time=datetime.fromisoformat(
                 data["created_time"].replace("Z", "+00:00")
             ),
@@ -47,8 +125,23 @@ class NotionDocument:
             ),
             created_by=NotionUser.from_api_response(data["created_by"]),
             last_edited_by=NotionUser.from_api_response(data["last_edited_by"]),
-            title=extract_title(data),
+            title=title,
             url=data.get("url"),
-            archived=data.get("archived", False),
-            properties=data.get("properties", {}),
+            archived=archived,
+            properties=properties,
+            content_hash=hash_encoded_content(title, properties, archived),
+            database_id=_database_id(database_id) if database_id else None,
         )
+
+
+@dataclass
+class DocumentActivity:
+    """Edits recorded against one document within a time window"""
+
+    document_id: str
+    title: str
+    edit_count: int
+    editors: List[NotionUser]
+    first_edited_time: datetime
+    last_edited_time: datetime
+    url: Optional[str] = None
@@ -1,14 +1,28 @@
+import asyncio
+import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from datetime import datetime
-from sqlalchemy import select
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session
 from src.infrastructure.database.models import (
     NotionDocumentModel,
     NotionUserModel,
     NotionDocumentVersionModel,
+    NotionStateModel,
+    NotionUpdateCooldownModel,
+    NotionLeaseModel,
 )
-from src.domain.notion.entities import NotionDocument, NotionUser
+from src.domain.notion.entities import DocumentActivity, NotionDocument, NotionUser
+from src.infrastructure.config.constants import (
+    MAX_LOOKUP_BATCH_SIZE,
+    VERSION_KEYFRAME_INTERVAL,
+)
+from src.infrastructure.tracing.tracer import TRACER
+from src.utils.json_patch import apply_patch, make_patch
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,72 +41,368 @@ class NotionRepository(ABC):
     def save(self, document: NotionDocument) -> None:
         pass
 
+    @abstractmethod
+    def get_documents_by_ids(self, ids: Iterable[str]) -> Dict[str, NotionDocument]:
+        pass
 
-class SQLNotionRepository(NotionRepository):
-    def __init__(self, session_factory: sessionmaker):
-        self.session_factory = session_factory
+    @abstractmethod
+    def save_documents_bulk(self, documents: List[NotionDocument]) -> None:
+        pass
 
-    def get_all(self) -> List[NotionDocument]:
-        with self.session_factory() as session:
-            result = session.execute(select(NotionDocumentModel))
-            return [doc.to_entity() for doc in result.scalars().all()]
 
-    def get_by_id(self, id: str) -> Optional[NotionDocument]:
-        with self.session_factory() as session:
+class NotionQueries:
+    """Repository operations run in a session and transaction owned by the caller
+
+    Each operation takes the session first and never commits, rolls back or
+    closes it. SQLNotionRepository runs them in a session and transaction of
+    their own, and the async repositories run the same statements through
+    ``AsyncSession.run_sync`` or a worker thread.
+    """
+
+    @staticmethod
+    def get_all(session: Session) -> List[NotionDocument]:
+        result = session.execute(select(NotionDocumentModel))
+        return [doc.to_entity() for doc in result.scalars().all()]
+
+    @staticmethod
+    def get_by_id(session: Session, id: str) -> Optional[NotionDocument]:
+        result = session.execute(
+            select(NotionDocumentModel).where(NotionDocumentModel.id == id)
+        )
+        db_doc = result.scalar_one_or_none()
+        return db_doc.to_entity() if db_doc else None
+
+    @staticmethod
+    def save(session: Session, document: NotionDocument) -> None:
+        session.add(NotionDocumentModel.from_entity(document))
+
+    @staticmethod
+    def get_documents_by_ids(
+        session: Session, ids: Iterable[str]
+    ) -> Dict[str, NotionDocument]:
+        """Get stored documents for many IDs, keyed by ID
+
+        IDs are looked up in chunked ``IN (...)`` queries inside one session,
+        so a whole sync pass costs a handful of round-trips.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        documents = {}
+        for start in range(0, len(unique_ids), MAX_LOOKUP_BATCH_SIZE):
+            chunk = unique_ids[start : start + MAX_LOOKUP_BATCH_SIZE]
             result = session.execute(
-                select(NotionDocumentModel).where(NotionDocumentModel.id == id)
+                select(NotionDocumentModel).where(NotionDocumentModel.id.in_(chunk))
             )
-            db_doc = result.scalar_one_or_none()
-            return db_doc.to_entity() if db_doc else None
+            for doc in result.scalars():
+                documents[doc.id] = doc.to_entity()
+        return documents
 
-    def save(self, document: NotionDocument) -> None:
-        with self.session_factory() as session:
-            db_doc = NotionDocumentModel.from_entity(document)
-            session.add(db_doc)
-            session.commit()
+    @staticmethod
+    def get_change_index(
+        session: Session, ids: Iterable[str]
+    ) -> Dict[str, Tuple[datetime, Optional[str]]]:
+        """Get ``id -> (last_edited_time, content_hash)`` for stored documents
 
-    def get_documents_updated_since(self, timestamp: datetime) -> List[NotionDocument]:
-        with self.session_factory() as session:
+        Only the projection needed for change detection is read, in the same
+        chunked ``IN (...)`` queries as ``get_documents_by_ids``.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        index = {}
+        for start in range(0, len(unique_ids), MAX_LOOKUP_BATCH_SIZE):
+            chunk = unique_ids[start : start + MAX_LOOKUP_BATCH_SIZE]
             result = session.execute(
-                select(NotionDocumentModel)
-                .where(NotionDocumentModel.last_edited_time > timestamp)
-                .order_by(NotionDocumentModel.last_edited_time)
+                select(
+                    NotionDocumentModel.id,
+                    NotionDocumentModel.last_edited_time,
+                    NotionDocumentModel.content_hash,
+                ).where(NotionDocumentModel.id.in_(chunk))
             )
-            return [doc.to_entity() for doc in result.scalars().all()]
+            for doc_id, last_edited_time, content_hash in result:
+                index[doc_id] = (last_edited_time, content_hash)
+        return index
 
-    def get_last_update_time(self, document_id: str) -> Optional[datetime]:
-        with self.session_factory() as session:
-            result = session.execute(
-                select(NotionDocumentModel.last_edited_time)
-                .where(NotionDocumentModel.id == document_id)
-                .order_by(NotionDocumentModel.last_edited_time.desc())
-                .limit(1)
+    @staticmethod
+    def get_documents_updated_since(
+        session: Session, since: datetime
+    ) -> List[NotionDocument]:
+        """Get all documents updated since a given time"""
+        result = session.execute(
+            select(NotionDocumentModel)
+            .where(NotionDocumentModel.last_edited_time >= since)
+            .order_by(NotionDocumentModel.last_edited_time)
+        )
+        return [doc.to_entity() for doc in result.scalars().all()]
+
+    @staticmethod
+    def get_document_activity(
+        session: Session, since: datetime, database_id: Optional[str] = None
+    ) -> List[DocumentActivity]:
+        """Summarise recorded versions per document since a given time
+
+        Edit counts and first/last edit times are aggregated per document and
+        editor in one query, joined to the current title and the stored user
+        names. The busiest documents come first.
+        """
+        edits = (
+            select(
+                NotionDocumentVersionModel.document_id,
+                NotionDocumentVersionModel.last_edited_by_id.label("editor_id"),
+                func.count().label("edit_count"),
+                func.min(NotionDocumentVersionModel.last_edited_time).label("first"),
+                func.max(NotionDocumentVersionModel.last_edited_time).label("last"),
             )
-            return result.scalar_one_or_none()
+            .where(NotionDocumentVersionModel.last_edited_time >= since)
+            .group_by(
+                NotionDocumentVersionModel.document_id,
+                NotionDocumentVersionModel.last_edited_by_id,
+            )
+            .subquery()
+        )
+        stmt = (
+            select(
+                edits,
+                NotionDocumentModel.title,
+                NotionDocumentModel.url,
+                NotionUserModel.name,
+            )
+            .join(NotionDocumentModel, NotionDocumentModel.id == edits.c.document_id)
+            .outerjoin(NotionUserModel, NotionUserModel.id == edits.c.editor_id)
+            .order_by(edits.c.document_id, edits.c.edit_count.desc())
+        )
+        if database_id:
+            stmt = stmt.where(NotionDocumentModel.database_id == database_id)
 
-    def save_user(self, user_data: dict):
-        """Save or update a user in the database"""
-        with self.session_factory() as session:
-            existing = session.get(NotionUserModel, user_data["id"])
+        activity: Dict[str, DocumentActivity] = {}
+        for row in session.execute(stmt):
+            entry = activity.get(row.document_id)
+            if entry is None:
+                entry = activity[row.document_id] = DocumentActivity(
+                    document_id=row.document_id,
+                    title=row.title,
+                    url=row.url,
+                    edit_count=0,
+                    editors=[],
+                    first_edited_time=row.first,
+                    last_edited_time=row.last,
+                )
+            entry.edit_count += row.edit_count
+            entry.first_edited_time = min(entry.first_edited_time, row.first)
+            entry.last_edited_time = max(entry.last_edited_time, row.last)
+            if row.editor_id:
+                entry.editors.append(NotionUser(id=row.editor_id, name=row.name))
+
+        return sorted(
+            activity.values(),
+            key=lambda entry: (entry.edit_count, entry.last_edited_time),
+            reverse=True,
+        )
+
+    @staticmethod
+    def get_last_update_time(session: Session, document_id: str) -> Optional[datetime]:
+        result = session.execute(
+            select(NotionDocumentModel.last_edited_time)
+            .where(NotionDocumentModel.id == document_id)
+            .order_by(NotionDocumentModel.last_edited_time.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
 
-            if existing:
-                existing.name = user_data.get("name", "Unknown User")
-                existing.email = user_data.get("email")
-                existing.type = user_data.get("type", "person")
-                existing.avatar_url = user_data.get("avatar_url")
+    @staticmethod
+    def get_sync_watermark(session: Session, sync_type: str) -> Optional[datetime]:
+        """Get the high-water mark recorded for a sync type"""
+        result = session.execute(
+            select(NotionStateModel.last_sync_time)
+            .where(NotionStateModel.sync_type == sync_type)
+            .order_by(NotionStateModel.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def save_sync_watermark(
+        session: Session,
+        sync_type: str,
+        last_sync_time: datetime,
+        cursor: Optional[str] = None,
+    ) -> None:
+        """Record the high-water mark for a sync type"""
+        state = session.execute(
+            select(NotionStateModel)
+            .where(NotionStateModel.sync_type == sync_type)
+            .order_by(NotionStateModel.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+        if state:
+            state.last_sync_time = last_sync_time
+            state.cursor = cursor
+            state.status = "completed"
+        else:
+            session.add(
+                NotionStateModel(
+                    last_sync_time=last_sync_time,
+                    cursor=cursor,
+                    sync_type=sync_type,
+                    status="completed",
+                )
+            )
+
+    @staticmethod
+    def get_update_cooldowns(session: Session, since: datetime) -> Dict[str, datetime]:
+        """Get ``document_id -> notified_at`` for notifications sent after ``since``"""
+        result = session.execute(
+            select(
+                NotionUpdateCooldownModel.document_id,
+                NotionUpdateCooldownModel.notified_at,
+            ).where(NotionUpdateCooldownModel.notified_at > since)
+        )
+        return dict(result.all())
+
+    @staticmethod
+    def save_update_cooldowns(
+        session: Session, notified_at: Dict[str, datetime], expired_before: datetime
+    ) -> None:
+        """Record notification times and drop cooldowns that have expired"""
+        if notified_at:
+            rows = [
+                {"document_id": document_id, "notified_at": timestamp}
+                for document_id, timestamp in notified_at.items()
+            ]
+            stmt = NotionQueries._upsert_statement(session, NotionUpdateCooldownModel)
+            if stmt is None:
+                for row in rows:
+                    session.merge(NotionUpdateCooldownModel(**row))
             else:
-                user = NotionUserModel(
-                    id=user_data["id"],
-                    name=user_data.get("name", "Unknown User"),
-                    email=user_data.get("email"),
-                    type=user_data.get("type", "person"),
-                    avatar_url=user_data.get("avatar_url"),
+                session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["document_id"],
+                        set_={"notified_at": stmt.excluded.notified_at},
+                    ),
+                    rows,
                 )
-                session.add(user)
 
-            session.commit()
+        session.execute(
+            delete(NotionUpdateCooldownModel).where(
+                NotionUpdateCooldownModel.notified_at <= expired_before
+            )
+        )
 
-    def _ensure_user_exists(self, session: Session, user: NotionUser) -> None:
+    @staticmethod
+    def save_users(session: Session, users: List[dict]) -> None:
+        """Save or update many users at once"""
+        if not users:
+            return
+
+        stmt = NotionQueries._upsert_statement(session, NotionUserModel)
+        if stmt is None:
+            for user_data in users:
+                session.merge(NotionUserModel(**user_data))
+            return
+
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "email": stmt.excluded.email,
+                    "type": stmt.excluded.type,
+                    "avatar_url": stmt.excluded.avatar_url,
+                },
+            ),
+            users,
+        )
+
+    @staticmethod
+    def save_user(session: Session, user_data: dict) -> None:
+        """Save or update a user in the database"""
+        existing = session.get(NotionUserModel, user_data["id"])
+
+        if existing:
+            existing.name = user_data.get("name", "Unknown User")
+            existing.email = user_data.get("email")
+            existing.type = user_data.get("type", "person")
+            existing.avatar_url = user_data.get("avatar_url")
+        else:
+            user = NotionUserModel(
+                id=user_data["id"],
+                name=user_data.get("name", "Unknown User"),
+                email=user_data.get("email"),
+                type=user_data.get("type", "person"),
+                avatar_url=user_data.get("avatar_url"),
+            )
+            session.add(user)
+
+    @staticmethod
+    def acquire_lease(
+        session: Session, name: str, holder: str, ttl: int, now: datetime
+    ) -> bool:
+        """Take or renew a named lease, returning whether ``holder`` now owns it
+
+        The lease is only taken over once it has expired, so at most one
+        holder owns it at a time provided replica clocks are kept in sync.
+        """
+        expires_at = now + timedelta(seconds=ttl)
+        result = session.execute(
+            update(NotionLeaseModel)
+            .where(
+                NotionLeaseModel.name == name,
+                or_(
+                    NotionLeaseModel.holder == holder,
+                    NotionLeaseModel.expires_at <= now,
+                ),
+            )
+            .values(holder=holder, expires_at=expires_at)
+        )
+        if result.rowcount:
+            return True
+
+        # A savepoint keeps losing the race for a new lease from aborting
+        # the caller's transaction
+        try:
+            with session.begin_nested():
+                session.add(
+                    NotionLeaseModel(name=name, holder=holder, expires_at=expires_at)
+                )
+            return True
+        except IntegrityError:
+            return False
+
+    @staticmethod
+    def release_lease(session: Session, name: str, holder: str) -> None:
+        """Give up a lease held by ``holder``"""
+        session.execute(
+            delete(NotionLeaseModel).where(
+                NotionLeaseModel.name == name, NotionLeaseModel.holder == holder
+            )
+        )
+
+    @staticmethod
+    def delete_expired_leases(session: Session, now: datetime) -> None:
+        """Remove leases left behind by replicas that stopped renewing"""
+        session.execute(
+            delete(NotionLeaseModel).where(NotionLeaseModel.expires_at <= now)
+        )
+
+    @staticmethod
+    def get_lease_holders(session: Session, now: datetime) -> Dict[str, str]:
+        """Get ``name -> holder`` for leases that have not expired"""
+        result = session.execute(
+            select(NotionLeaseModel.name, NotionLeaseModel.holder).where(
+                NotionLeaseModel.expires_at > now
+            )
+        )
+        return dict(result.all())
+
+    @staticmethod
+    def get_users(session: Session) -> List[NotionUser]:
+        """Get all stored users"""
+        result = session.execute(select(NotionUserModel))
+        return [
+            NotionUser(id=user.id, name=user.name, avatar_url=user.avatar_url)
+            for user in result.scalars()
+        ]
+
+    @staticmethod
+    def _ensure_user_exists(session: Session, user: NotionUser) -> None:
         """Ensure user exists in database"""
         if not user:
             return
@@ -104,114 +414,531 @@ class SQLNotionRepository(NotionRepository):
             )
             session.add(user_model)
 
-    def save_document(self, document: NotionDocument):
+    @staticmethod
+    def _encode_version(
+        properties: Optional[dict],
+        previous_properties: Optional[dict],
+        previous_sequence: Optional[int],
+    ) -> dict:
+        """Build the delta-encoding columns for a new version
+
+        A version is a keyframe holding full properties when it starts a
+        document's numbered history or falls on the keyframe interval;
+        otherwise it holds a JSON Patch against the previous properties.
+        """
+        sequence = 0 if previous_sequence is None else previous_sequence + 1
+        if (
+            previous_sequence is None
+            or previous_properties is None
+            or sequence % VERSION_KEYFRAME_INTERVAL == 0
+        ):
+            return {
+                "sequence": sequence,
+                "is_keyframe": True,
+                "properties": properties,
+                "delta": None,
+            }
+
+        return {
+            "sequence": sequence,
+            "is_keyframe": False,
+            "properties": None,
+            "delta": make_patch(previous_properties, properties),
+        }
+
+    @staticmethod
+    def save_document(session: Session, document: NotionDocument) -> None:
         """Save or update a document in the database"""
-        with self.session_factory() as session:
-            with session.begin():
-                self._ensure_user_exists(session, document.created_by)
-                self._ensure_user_exists(session, document.last_edited_by)
-
-                existing = session.get(NotionDocumentModel, document.id)
-
-                version = NotionDocumentVersionModel(
-                    document_id=document.id,
-                    object=document.object,
-                    created_time=document.created_time,
-                    last_edited_time=document.last_edited_time,
-                    created_by_id=(
-                        document.created_by.id if document.created_by else None
+        NotionQueries._ensure_user_exists(session, document.created_by)
+        NotionQueries._ensure_user_exists(session, document.last_edited_by)
+
+        existing = session.get(NotionDocumentModel, document.id)
+        properties = document.properties
+        previous_sequence = session.execute(
+            select(func.max(NotionDocumentVersionModel.sequence)).where(
+                NotionDocumentVersionModel.document_id == document.id
+            )
+        ).scalar()
+
+        version = NotionDocumentVersionModel(
+            document_id=document.id,
+            object=document.object,
+            created_time=document.created_time,
+            last_edited_time=document.last_edited_time,
+            created_by_id=document.created_by.id if document.created_by else None,
+            last_edited_by_id=(
+                document.last_edited_by.id if document.last_edited_by else None
+            ),
+            title=document.title,
+            url=document.url,
+            archived=document.archived,
+            content_hash=document.content_hash,
+            **NotionQueries._encode_version(
+                properties,
+                existing.properties if existing else None,
+                previous_sequence,
+            ),
+        )
+        session.add(version)
+
+        if existing:
+            existing.object = document.object
+            existing.created_time = document.created_time
+            existing.last_edited_time = document.last_edited_time
+            existing.title = document.title
+            existing.url = document.url
+            existing.archived = document.archived
+            existing.properties = properties
+            existing.content_hash = document.content_hash
+            existing.database_id = document.database_id or existing.database_id
+            existing.created_by_id = (
+                document.created_by.id if document.created_by else None
+            )
+            existing.last_edited_by_id = (
+                document.last_edited_by.id if document.last_edited_by else None
+            )
+        else:
+            doc = NotionDocumentModel(
+                id=document.id,
+                object=document.object,
+                created_time=document.created_time,
+                last_edited_time=document.last_edited_time,
+                created_by_id=document.created_by.id if document.created_by else None,
+                last_edited_by_id=(
+                    document.last_edited_by.id if document.last_edited_by else None
+                ),
+                title=document.title,
+                url=document.url,
+                archived=document.archived,
+                properties=properties,
+                content_hash=document.content_hash,
+                database_id=document.database_id,
+            )
+            session.add(doc)
+
+        logger.info(f"Successfully saved document and version: {document.title}")
+
+    @staticmethod
+    def _upsert_statement(session: Session, model):
+        """Get a dialect-native INSERT supporting ON CONFLICT, if available"""
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(model)
+        if dialect == "sqlite":
+            return sqlite.insert(model)
+        return None
+
+    @staticmethod
+    def save_documents_bulk(session: Session, documents: List[NotionDocument]) -> None:
+        """Save or update many documents and their versions together
+
+        Users and documents are written with ``INSERT ... ON CONFLICT`` and
+        versions with a single multi-row insert. Dialects without ON CONFLICT
+        support fall back to saving documents one by one.
+        """
+        if not documents:
+            return
+
+        documents = list({document.id: document for document in documents}.values())
+
+        upsert_users = NotionQueries._upsert_statement(session, NotionUserModel)
+        upsert_documents = NotionQueries._upsert_statement(session, NotionDocumentModel)
+        if upsert_users is None or upsert_documents is None:
+            for document in documents:
+                NotionQueries.save_document(session, document)
+            return
+
+        users = {}
+        document_rows = []
+        version_rows = []
+        for document in documents:
+            for user in (document.created_by, document.last_edited_by):
+                if user and user.id not in users:
+                    users[user.id] = {
+                        "id": user.id,
+                        "name": user.name or "Unknown User",
+                        "avatar_url": user.avatar_url,
+                    }
+
+            row = {
+                "object": document.object,
+                "created_time": document.created_time,
+                "last_edited_time": document.last_edited_time,
+                "created_by_id": (
+                    document.created_by.id if document.created_by else None
+                ),
+                "last_edited_by_id": (
+                    document.last_edited_by.id if document.last_edited_by else None
+                ),
+                "title": document.title,
+                "url": document.url,
+                "archived": document.archived,
+                "properties": document.properties,
+                "content_hash": document.content_hash,
+            }
+            document_rows.append(
+                {"id": document.id, "database_id": document.database_id, **row}
+            )
+
+        previous_properties = {}
+        previous_sequences = {}
+        ids = [document.id for document in documents]
+        for start in range(0, len(ids), MAX_LOOKUP_BATCH_SIZE):
+            chunk = ids[start : start + MAX_LOOKUP_BATCH_SIZE]
+            previous_properties.update(
+                session.execute(
+                    select(
+                        NotionDocumentModel.id, NotionDocumentModel.properties
+                    ).where(NotionDocumentModel.id.in_(chunk))
+                ).all()
+            )
+            previous_sequences.update(
+                session.execute(
+                    select(
+                        NotionDocumentVersionModel.document_id,
+                        func.max(NotionDocumentVersionModel.sequence),
+                    )
+                    .where(NotionDocumentVersionModel.document_id.in_(chunk))
+                    .group_by(NotionDocumentVersionModel.document_id)
+                ).all()
+            )
+
+        for document, row in zip(documents, document_rows):
+            version_rows.append(
+                {
+                    **row,
+                    "id": str(uuid.uuid4()),
+                    "document_id": document.id,
+                    **NotionQueries._encode_version(
+                        row["properties"],
+                        previous_properties.get(document.id),
+                        previous_sequences.get(document.id),
                     ),
-                    last_edited_by_id=(
-                        document.last_edited_by.id if document.last_edited_by else None
+                }
+            )
+
+        # Existing users keep the names resolved through save_user
+        session.execute(
+            upsert_users.on_conflict_do_nothing(index_elements=["id"]),
+            list(users.values()),
+        )
+
+        stmt = upsert_documents
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in document_rows[0]
+                        if column != "id"
+                    },
+                    # Pages fetched without a parent keep their partition
+                    "database_id": func.coalesce(
+                        stmt.excluded.database_id,
+                        NotionDocumentModel.database_id,
                     ),
-                    title=document.title,
-                    url=document.url,
-                    archived=document.archived,
-                    properties=document.properties,
-                )
-                session.add(version)
-
-                if existing:
-                    existing.object = document.object
-                    existing.created_time = document.created_time
-                    existing.last_edited_time = document.last_edited_time
-                    existing.title = document.title
-                    existing.url = document.url
-                    existing.archived = document.archived
-                    existing.properties = document.properties
-                    existing.created_by_id = (
-                        document.created_by.id if document.created_by else None
-                    )
-                    existing.last_edited_by_id = (
-                        document.last_edited_by.id if document.last_edited_by else None
-                    )
-                else:
-                    doc = NotionDocumentModel(
-                        id=document.id,
-                        object=document.object,
-                        created_time=document.created_time,
-                        last_edited_time=document.last_edited_time,
-                        created_by_id=(
-                            document.created_by.id if document.created_by else None
-                        ),
-                        last_edited_by_id=(
-                            document.last_edited_by.id
-                            if document.last_edited_by
-                            else None
-                        ),
-                        title=document.title,
-                        url=document.url,
-                        archived=document.archived,
-                        properties=document.properties,
-                    )
-                    session.add(doc)
+                },
+            ),
+            document_rows,
+        )
 
-                session.commit()
-                logger.info(
-                    f"Successfully saved document and version: {document.title}"
-                )
+        session.execute(insert(NotionDocumentVersionModel), version_rows)
 
-    def get_document(self, document_id: str) -> Optional[NotionDocument]:
+        logger.info(f"Successfully bulk saved {len(documents)} documents")
+
+    @staticmethod
+    def get_document(session: Session, document_id: str) -> Optional[NotionDocument]:
         """Get a document by ID"""
-        with self.session_factory() as session:
-            result = session.get(NotionDocumentModel, document_id)
-            if not result:
-                return None
-
-            return NotionDocument(
-                id=result.id,
-                object=result.object,
-                created_time=result.created_time,
-                last_edited_time=result.last_edited_time,
-                created_by=NotionUser(id=result.created_by_id),
-                last_edited_by=NotionUser(id=result.last_edited_by_id),
-                title=result.title,
-                url=result.url,
-                archived=result.archived,
-                properties=result.properties,
+        result = session.get(NotionDocumentModel, document_id)
+        if not result:
+            return None
+
+        return NotionDocument(
+            id=result.id,
+            object=result.object,
+            created_time=result.created_time,
+            last_edited_time=result.last_edited_time,
+            created_by=NotionUser(id=result.created_by_id),
+            last_edited_by=NotionUser(id=result.last_edited_by_id),
+            title=result.title,
+            url=result.url,
+            archived=result.archived,
+            properties=result.properties,
+            content_hash=result.content_hash,
+            database_id=result.database_id,
+        )
+
+    @staticmethod
+    def get_document_version(
+        session: Session, document_id: str, sequence: int
+    ) -> Optional[NotionDocument]:
+        """Rebuild a stored version from its nearest keyframe and deltas"""
+        keyframe = session.execute(
+            select(NotionDocumentVersionModel)
+            .where(
+                NotionDocumentVersionModel.document_id == document_id,
+                NotionDocumentVersionModel.is_keyframe.is_(True),
+                NotionDocumentVersionModel.sequence <= sequence,
             )
+            .order_by(NotionDocumentVersionModel.sequence.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        if not keyframe:
+            return None
 
-    def get_documents_updated_since(self, since: datetime) -> List[NotionDocument]:
-        """Get all documents updated since a given time"""
-        stmt = select(NotionDocumentModel).where(
-            NotionDocumentModel.last_edited_time >= since
+        versions = session.execute(
+            select(NotionDocumentVersionModel)
+            .where(
+                NotionDocumentVersionModel.document_id == document_id,
+                NotionDocumentVersionModel.sequence > keyframe.sequence,
+                NotionDocumentVersionModel.sequence <= sequence,
+            )
+            .order_by(NotionDocumentVersionModel.sequence)
+        ).scalars()
+
+        target = keyframe
+        properties = keyframe.properties
+        for version in versions:
+            properties = apply_patch(properties, version.delta or [])
+            target = version
+
+        if target.sequence != sequence:
+            return None
+
+        return NotionDocument(
+            id=document_id,
+            object=target.object,
+            created_time=target.created_time,
+            last_edited_time=target.last_edited_time,
+            created_by=NotionUser(id=target.created_by_id),
+            last_edited_by=NotionUser(id=target.last_edited_by_id),
+            title=target.title,
+            url=target.url,
+            archived=target.archived,
+            properties=properties,
+            content_hash=target.content_hash,
         )
+
+
+class SQLNotionRepository(NotionRepository):
+    """Blocking repository running each call in its own session and transaction"""
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def run_in_session(self, operation: Callable, *args, **kwargs) -> Any:
+        """Run a NotionQueries operation in a new session and transaction"""
         with self.session_factory() as session:
-            result = session.execute(stmt)
-            documents = result.scalars().all()
-
-            return [
-                NotionDocument(
-                    id=doc.id,
-                    object=doc.object,
-                    created_time=doc.created_time,
-                    last_edited_time=doc.last_edited_time,
-                    created_by=NotionUser(id=doc.created_by_id),
-                    last_edited_by=NotionUser(id=doc.last_edited_by_id),
-                    title=doc.title,
-                    url=doc.url,
-                    archived=doc.archived,
-                    properties=doc.properties,
-                )
-                for doc in documents
-            ]
+            with session.begin():
+                return operation(session, *args, **kwargs)
+
+    def get_all(self) -> List[NotionDocument]:
+        return self.run_in_session(NotionQueries.get_all)
+
+    def get_by_id(self, id: str) -> Optional[NotionDocument]:
+        return self.run_in_session(NotionQueries.get_by_id, id)
+
+    def save(self, document: NotionDocument) -> None:
+        self.run_in_session(NotionQueries.save, document)
+
+    def get_documents_by_ids(self, ids: Iterable[str]) -> Dict[str, NotionDocument]:
+        return self.run_in_session(NotionQueries.get_documents_by_ids, ids)
+
+    def get_change_index(
+        self, ids: Iterable[str]
+    ) -> Dict[str, Tuple[datetime, Optional[str]]]:
+        return self.run_in_session(NotionQueries.get_change_index, ids)
+
+    def get_documents_updated_since(self, since: datetime) -> List[NotionDocument]:
+        return self.run_in_session(NotionQueries.get_documents_updated_since, since)
+
+    def get_document_activity(
+        self, since: datetime, database_id: Optional[str] = None
+    ) -> List[DocumentActivity]:
+        return self.run_in_session(
+            NotionQueries.get_document_activity, since, database_id
+        )
+
+    def get_last_update_time(self, document_id: str) -> Optional[datetime]:
+        return self.run_in_session(NotionQueries.get_last_update_time, document_id)
+
+    def get_sync_watermark(self, sync_type: str) -> Optional[datetime]:
+        return self.run_in_session(NotionQueries.get_sync_watermark, sync_type)
+
+    def save_sync_watermark(
+        self, sync_type: str, last_sync_time: datetime, cursor: Optional[str] = None
+    ) -> None:
+        self.run_in_session(
+            NotionQueries.save_sync_watermark, sync_type, last_sync_time, cursor
+        )
+
+    def get_update_cooldowns(self, since: datetime) -> Dict[str, datetime]:
+        return self.run_in_session(NotionQueries.get_update_cooldowns, since)
+
+    def save_update_cooldowns(
+        self, notified_at: Dict[str, datetime], expired_before: datetime
+    ) -> None:
+        self.run_in_session(
+            NotionQueries.save_update_cooldowns, notified_at, expired_before
+        )
+
+    def save_users(self, users: List[dict]) -> None:
+        self.run_in_session(NotionQueries.save_users, users)
+
+    def save_user(self, user_data: dict) -> None:
+        self.run_in_session(NotionQueries.save_user, user_data)
+
+    def acquire_lease(self, name: str, holder: str, ttl: int, now: datetime) -> bool:
+        return self.run_in_session(NotionQueries.acquire_lease, name, holder, ttl, now)
+
+    def release_lease(self, name: str, holder: str) -> None:
+        self.run_in_session(NotionQueries.release_lease, name, holder)
+
+    def delete_expired_leases(self, now: datetime) -> None:
+        self.run_in_session(NotionQueries.delete_expired_leases, now)
+
+    def get_lease_holders(self, now: datetime) -> Dict[str, str]:
+        return self.run_in_session(NotionQueries.get_lease_holders, now)
+
+    def get_users(self) -> List[NotionUser]:
+        return self.run_in_session(NotionQueries.get_users)
+
+    def save_document(self, document: NotionDocument) -> None:
+        self.run_in_session(NotionQueries.save_document, document)
+
+    def save_documents_bulk(self, documents: List[NotionDocument]) -> None:
+        self.run_in_session(NotionQueries.save_documents_bulk, documents)
+
+    def get_document(self, document_id: str) -> Optional[NotionDocument]:
+        return self.run_in_session(NotionQueries.get_document, document_id)
+
+    def get_document_version(
+        self, document_id: str, sequence: int
+    ) -> Optional[NotionDocument]:
+        return self.run_in_session(
+            NotionQueries.get_document_version, document_id, sequence
+        )
+
+
+class AsyncNotionRepository(ABC):
+    """Awaitable repository for use on the event loop"""
+
+    @abstractmethod
+    async def _run(self, operation: Callable, *args, **kwargs) -> Any:
+        """Run a NotionQueries operation without blocking the event loop"""
+        pass
+
+    async def get_document(self, document_id: str) -> Optional[NotionDocument]:
+        return await self._run(NotionQueries.get_document, document_id)
+
+    async def get_documents_by_ids(
+        self, ids: Iterable[str]
+    ) -> Dict[str, NotionDocument]:
+        return await self._run(NotionQueries.get_documents_by_ids, list(ids))
+
+    async def get_change_index(
+        self, ids: Iterable[str]
+    ) -> Dict[str, Tuple[datetime, Optional[str]]]:
+        return await self._run(NotionQueries.get_change_index, list(ids))
+
+    async def get_document_version(
+        self, document_id: str, sequence: int
+    ) -> Optional[NotionDocument]:
+        return await self._run(
+            NotionQueries.get_document_version, document_id, sequence
+        )
+
+    async def get_documents_updated_since(
+        self, since: datetime
+    ) -> List[NotionDocument]:
+        return await self._run(NotionQueries.get_documents_updated_since, since)
+
+    async def get_document_activity(
+        self, since: datetime, database_id: Optional[str] = None
+    ) -> List[DocumentActivity]:
+        return await self._run(NotionQueries.get_document_activity, since, database_id)
+
+    async def get_last_update_time(self, document_id: str) -> Optional[datetime]:
+        return await self._run(NotionQueries.get_last_update_time, document_id)
+
+    async def get_sync_watermark(self, sync_type: str) -> Optional[datetime]:
+        return await self._run(NotionQueries.get_sync_watermark, sync_type)
+
+    async def save_sync_watermark(
+        self, sync_type: str, last_sync_time: datetime, cursor: Optional[str] = None
+    ) -> None:
+        await self._run(
+            NotionQueries.save_sync_watermark, sync_type, last_sync_time, cursor
+        )
+
+    async def get_users(self) -> List[NotionUser]:
+        return await self._run(NotionQueries.get_users)
+
+    async def acquire_lease(
+        self, name: str, holder: str, ttl: int, now: datetime
+    ) -> bool:
+        return await self._run(NotionQueries.acquire_lease, name, holder, ttl, now)
+
+    async def release_lease(self, name: str, holder: str) -> None:
+        await self._run(NotionQueries.release_lease, name, holder)
+
+    async def delete_expired_leases(self, now: datetime) -> None:
+        await self._run(NotionQueries.delete_expired_leases, now)
+
+    async def get_lease_holders(self, now: datetime) -> Dict[str, str]:
+        return await self._run(NotionQueries.get_lease_holders, now)
+
+    async def get_update_cooldowns(self, since: datetime) -> Dict[str, datetime]:
+        return await self._run(NotionQueries.get_update_cooldowns, since)
+
+    async def save_update_cooldowns(
+        self, notified_at: Dict[str, datetime], expired_before: datetime
+    ) -> None:
+        await self._run(
+            NotionQueries.save_update_cooldowns, notified_at, expired_before
+        )
+
+    async def save_user(self, user_data: dict) -> None:
+        await self._run(NotionQueries.save_user, user_data)
+
+    async def save_users(self, users: List[dict]) -> None:
+        await self._run(NotionQueries.save_users, users)
+
+    async def save_document(self, document: NotionDocument) -> None:
+        await self._run(NotionQueries.save_document, document)
+
+    async def save_documents_bulk(self, documents: List[NotionDocument]) -> None:
+        await self._run(NotionQueries.save_documents_bulk, documents)
+
+
+class AsyncSQLNotionRepository(AsyncNotionRepository):
+    """Native asyncio repository on an AsyncSession (asyncpg driver)
+
+    Each call checks out an AsyncSession, begins a transaction and runs the
+    NotionQueries operation in it through ``run_sync``, so the statements are
+    shared with the sync repository while all I/O goes through the async
+    driver.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+
+    async def _run(self, operation: Callable, *args, **kwargs) -> Any:
+        with TRACER.span(f"repository.{operation.__name__}"):
+            async with self.session_factory() as session:
+                async with session.begin():
+                    return await session.run_sync(operation, *args, **kwargs)
+
+
+class ThreadedNotionRepository(AsyncNotionRepository):
+    """Run a blocking SQLNotionRepository in worker threads"""
+
+    def __init__(self, repository: SQLNotionRepository):
+        self.repository = repository
+
+    async def _run(self, operation: Callable, *args, **kwargs) -> Any:
+        with TRACER.span(f"repository.{operation.__name__}"):
+            return await asyncio.to_thread(
+                self.repository.run_in_session, operation, *args, **kwargs
+            )
@@ -14,14 +14,74 @@ WEEKLY_UPDATE_INTERVAL = timedelta(days=7)
 DEFAULT_RETRY_DELAY = 1
 DEFAULT_RETRY_BACKOFF = 2
 MAX_RETRY_ATTEMPTS = 3
+MAX_RETRY_DELAY = 30
+MIN_POLL_INTERVAL = 15  # seconds between polls of an active database
+MAX_POLL_INTERVAL = 600  # seconds between polls of an idle database
+POLL_BACKOFF_FACTOR = 2.0
+NOTION_TIME_PRECISION = timedelta(minutes=1)  # Notion rounds edit times down
+
+# Notion API Constants
+NOTION_RATE_LIMIT = 3.0  # requests per second
+NOTION_RATE_BURST = 3
+MAX_CONCURRENT_USER_REQUESTS = 3
+USER_CACHE_MAX_SIZE = 10000
+USER_CACHE_TTL = 60 * 60 * 24
+USER_NEGATIVE_CACHE_TTL = 60 * 10
+
+# Discord Delivery Constants
+DISCORD_ROUTE_RATE = 1.0  # messages per second per channel
+DISCORD_ROUTE_BURST = 5
+MAX_DISPATCH_QUEUE_SIZE = 1000
+DISCORD_MESSAGE_LIMIT = 2000
+NOTIFICATION_DIGEST_THRESHOLD = 50
 
 # Database Constants
 MAX_BATCH_SIZE = 100
 DEFAULT_PAGE_SIZE = 50
+MAX_LOOKUP_BATCH_SIZE = 1000
+VERSION_KEYFRAME_INTERVAL = 20
+
+# Notion Webhook Constants
+WEBHOOK_PAGE_EVENTS = {
+    "page.created",
+    "page.content_updated",
+    "page.properties_updated",
+    "page.moved",
+    "page.undeleted",
+}
+WEBHOOK_DELETE_EVENTS = {"page.deleted"}
+WEBHOOK_SIGNATURE_HEADER = "X-Notion-Signature"
+WEBHOOK_PATH = "/notion/webhook"
+WEBHOOK_PORT = 8080
+WEBHOOK_FLUSH_INTERVAL = 5  # seconds events are batched before syncing
+WEBHOOK_RECONCILE_INTERVAL = 900  # seconds between safety-net polls
+
+# Metrics Endpoint Constants
+METRICS_PATH = "/metrics"
+METRICS_PORT = 9090
+
+# Tracing and Profiling Constants
+TRACE_FORMAT_JSON = "json"
+TRACE_FORMAT_OTLP = "otlp"
+TRACE_FILE = "traces.jsonl"
+PROFILE_DIR = "profiles"
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+
+# Coordination Modes
+COORDINATION_NONE = "none"
+COORDINATION_LEADER = "leader"
+COORDINATION_SHARD = "shard"
+LEASE_TTL = 30  # seconds a replica holds a lease without renewing it
+LEADER_LEASE = "leader"
+
+# Sync State Types
+SYNC_TYPE_UPDATES = "updates"
+SYNC_TYPE_WEEKLY_SUMMARY = "weekly_summary"
 
 # Message Templates
 MESSAGE_TEMPLATES = {
     "creation": "🧬 {} 🧬",
     "update": "📡 {} Update 📡",
     "weekly_summary": "📊 Weekly Summary 📊",
+    "more_updates": "…and {} more updates",
 }
@@ -1,6 +1,9 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from src.infrastructure.metrics.instruments import DB_POOL_CHECKED_OUT
 
 
 def get_database_url():
@@ -19,8 +22,31 @@ def get_database_url():
     return f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:5432/{DB_NAME}"
 
 
+def is_postgres_url(database_url: str) -> bool:
+    """Whether a database URL points at PostgreSQL, whatever its driver"""
+    return make_url(database_url).get_backend_name() in ("postgresql", "postgres")
+
+
+def get_async_database_url():
+    """Get the database URL rewritten for the asyncpg driver"""
+    database_url = get_database_url()
+    if not is_postgres_url(database_url):
+        raise ValueError("ASYNC_DATABASE requires a PostgreSQL DATABASE_URL")
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+
+    # asyncpg takes ``ssl`` rather than libpq's ``sslmode``
+    sslmode = url.query.get("sslmode")
+    if sslmode:
+        url = url.difference_update_query(["sslmode"]).update_query_dict(
+            {"ssl": sslmode}
+        )
+
+    return url
+
+
 # Create engine
 engine = None
+async_engine = None
 if os.getenv("ENV") != "TEST":
     url = get_database_url().replace("postgres://", "postgresql+psycopg2://", 1)
 
@@ -34,6 +60,7 @@ if os.getenv("ENV") != "TEST":
         pool_recycle=1800,
         echo=True,
     )
+    DB_POOL_CHECKED_OUT.set_function(engine.pool.checkedout, driver="psycopg2")
 
 Base = declarative_base()
 
@@ -45,6 +72,25 @@ def create_session():
     return sessionmaker(engine, class_=Session, expire_on_commit=False)
 
 
+def create_async_session():
+    """Create asyncio database session factory, building the engine on first use"""
+    global async_engine
+    if async_engine is None:
+        if os.getenv("ENV") == "TEST":
+            raise RuntimeError("Database engine not initialized")
+
+        async_engine = create_async_engine(
+            get_async_database_url(),
+            pool_size=5,
+            max_overflow=10,
+            pool_timeout=30,
+            pool_recycle=1800,
+        )
+        DB_POOL_CHECKED_OUT.set_function(async_engine.pool.checkedout, driver="asyncpg")
+
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
 def verify_database():
     """Verify database connection"""
     if engine is None:
@@ -1,9 +1,69 @@
 from dotenv import load_dotenv
 import os
 from dataclasses import dataclass
-from typing import List
-from .constants import COLLECTIVE_DB, NOTION_NOTIFICATION_CHANNELS
+from typing import List, Optional
+from .constants import (
+    COLLECTIVE_DB,
+    COORDINATION_NONE,
+    LEASE_TTL,
+    MAX_POLL_INTERVAL,
+    METRICS_PORT,
+    PROFILE_DIR,
+    TRACE_FILE,
+    TRACE_FORMAT_JSON,
+    MIN_POLL_INTERVAL,
+    NOTIFICATION_DIGEST_THRESHOLD,
+    NOTION_NOTIFICATION_CHANNELS,
+    WEBHOOK_PATH,
+    WEBHOOK_PORT,
+    WEBHOOK_RECONCILE_INTERVAL,
+)
 from src.infrastructure.config.database import get_database_url
+from src.utils.notion_utils import normalize_notion_id
+
+
+@dataclass
+class WatchedDatabase:
+    """A Notion database polled by the bot and the channels it notifies"""
+
+    database_id: str
+    channels: List[int]
+    min_interval: int = MIN_POLL_INTERVAL
+    max_interval: int = MAX_POLL_INTERVAL
+
+
+def parse_channels(value: str) -> List[int]:
+    """Parse a comma separated list of Discord channel IDs"""
+    return [int(channel.strip()) for channel in value.split(",") if channel.strip()]
+
+
+def parse_databases(
+    value: str, default_channels: List[int], min_interval: int, max_interval: int
+) -> List[WatchedDatabase]:
+    """Parse ``id[:channels[:min[-max]]]`` entries separated by semicolons
+
+    A single interval polls the database at a fixed rate.
+    """
+    databases = []
+    for entry in value.split(";"):
+        if not entry.strip():
+            continue
+        database_id, _, rest = entry.strip().partition(":")
+        channels, _, interval = rest.partition(":")
+        low, _, high = interval.partition("-")
+        databases.append(
+            WatchedDatabase(
+                database_id=normalize_notion_id(database_id.strip()),
+                channels=parse_channels(channels) or default_channels,
+                min_interval=int(low) if low.strip() else min_interval,
+                max_interval=(
+                    int(high)
+                    if high.strip()
+                    else int(low) if low.strip() else max_interval
+                ),
+            )
+        )
+    return databases
 
 
 @dataclass
@@ -15,10 +75,32 @@ class Settings:
     DISCORD_BOT_TOKEN: str
     NOTION_DATABASE_ID: str
     NOTION_NOTIFICATION_CHANNELS: List[int]
+    NOTION_DATABASES: List[WatchedDatabase]
 
     UPDATE_INTERVAL: int = 10
     AGGREGATE_UPDATE_INTERVAL: int = 60 * 60 * 24
     UPDATE_COOLDOWN: int = 14400
+    ASYNC_DATABASE: bool = True
+    NOTIFICATION_DIGEST_THRESHOLD: int = NOTIFICATION_DIGEST_THRESHOLD
+    POLL_INTERVAL_MIN: int = MIN_POLL_INTERVAL
+    POLL_INTERVAL_MAX: int = MAX_POLL_INTERVAL
+    NOTION_WEBHOOK_ENABLED: bool = False
+    NOTION_WEBHOOK_SECRET: Optional[str] = None
+    NOTION_WEBHOOK_HOST: str = "0.0.0.0"
+    NOTION_WEBHOOK_PORT: int = WEBHOOK_PORT
+    NOTION_WEBHOOK_PATH: str = WEBHOOK_PATH
+    WEBHOOK_RECONCILE_INTERVAL: int = WEBHOOK_RECONCILE_INTERVAL
+    COORDINATION_MODE: str = COORDINATION_NONE
+    LEASE_TTL: int = LEASE_TTL
+    METRICS_ENABLED: bool = False
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PORT: int = METRICS_PORT
+    TRACING_ENABLED: bool = False
+    TRACE_FORMAT: str = TRACE_FORMAT_JSON
+    TRACE_FILE: str = TRACE_FILE
+    TRACE_OTLP_ENDPOINT: Optional[str] = None
+    PROFILE_EVERY_N_CYCLES: int = 0
+    PROFILE_DIR: str = PROFILE_DIR
 
     def __init__(self):
         load_dotenv()
@@ -27,11 +109,58 @@ class Settings:
         self.NOTION_TOKEN = os.getenv("NOTION_TOKEN")
         self.DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
         self.NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
-        self.NOTION_NOTIFICATION_CHANNELS = [
-            int(channel.strip())
-            for channel in os.getenv("NOTION_NOTIFICATION_CHANNELS", "").split(",")
-            if channel.strip()
-        ] or NOTION_NOTIFICATION_CHANNELS
+        self.NOTION_NOTIFICATION_CHANNELS = (
+            parse_channels(os.getenv("NOTION_NOTIFICATION_CHANNELS", ""))
+            or NOTION_NOTIFICATION_CHANNELS
+        )
+        self.POLL_INTERVAL_MIN = int(os.getenv("POLL_INTERVAL_MIN", MIN_POLL_INTERVAL))
+        self.POLL_INTERVAL_MAX = int(os.getenv("POLL_INTERVAL_MAX", MAX_POLL_INTERVAL))
+        self.NOTION_DATABASES = parse_databases(
+            os.getenv("NOTION_DATABASES", ""),
+            self.NOTION_NOTIFICATION_CHANNELS,
+            self.POLL_INTERVAL_MIN,
+            self.POLL_INTERVAL_MAX,
+        )
+        if not self.NOTION_DATABASES and self.NOTION_DATABASE_ID:
+            self.NOTION_DATABASES = [
+                WatchedDatabase(
+                    database_id=normalize_notion_id(self.NOTION_DATABASE_ID),
+                    channels=self.NOTION_NOTIFICATION_CHANNELS,
+                    min_interval=self.POLL_INTERVAL_MIN,
+                    max_interval=self.POLL_INTERVAL_MAX,
+                )
+            ]
+        self.NOTION_WEBHOOK_ENABLED = (
+            os.getenv("NOTION_WEBHOOK_ENABLED", "false").lower() == "true"
+        )
+        self.NOTION_WEBHOOK_SECRET = os.getenv("NOTION_WEBHOOK_SECRET")
+        self.NOTION_WEBHOOK_HOST = os.getenv("NOTION_WEBHOOK_HOST", "0.0.0.0")
+        self.NOTION_WEBHOOK_PORT = int(os.getenv("NOTION_WEBHOOK_PORT", WEBHOOK_PORT))
+        self.NOTION_WEBHOOK_PATH = os.getenv("NOTION_WEBHOOK_PATH", WEBHOOK_PATH)
+        self.WEBHOOK_RECONCILE_INTERVAL = int(
+            os.getenv("WEBHOOK_RECONCILE_INTERVAL", WEBHOOK_RECONCILE_INTERVAL)
+        )
+        if self.NOTION_WEBHOOK_ENABLED:
+            # Webhooks carry the changes; polling is only a safety net
+            for database in self.NOTION_DATABASES:
+                database.min_interval = database.max_interval = max(
+                    database.max_interval, self.WEBHOOK_RECONCILE_INTERVAL
+                )
+        self.COORDINATION_MODE = os.getenv("COORDINATION_MODE", COORDINATION_NONE)
+        self.LEASE_TTL = int(os.getenv("LEASE_TTL", LEASE_TTL))
+        self.METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+        self.METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+        self.METRICS_PORT = int(os.getenv("METRICS_PORT", METRICS_PORT))
+        self.TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+        self.TRACE_FORMAT = os.getenv("TRACE_FORMAT", TRACE_FORMAT_JSON)
+        self.TRACE_FILE = os.getenv("TRACE_FILE", TRACE_FILE)
+        self.TRACE_OTLP_ENDPOINT = os.getenv("TRACE_OTLP_ENDPOINT")
+        self.PROFILE_EVERY_N_CYCLES = int(os.getenv("PROFILE_EVERY_N_CYCLES", "0"))
+        self.PROFILE_DIR = os.getenv("PROFILE_DIR", PROFILE_DIR)
+        self.ASYNC_DATABASE = os.getenv("ASYNC_DATABASE", "true").lower() == "true"
+        self.NOTIFICATION_DIGEST_THRESHOLD = int(
+            os.getenv("NOTIFICATION_DIGEST_THRESHOLD", NOTIFICATION_DIGEST_THRESHOLD)
+        )
 
     @classmethod
     def load_from_env(cls) -> "Settings":
@@ -47,6 +176,12 @@ class Settings:
             DATABASE_URL=database_url,
             NOTION_DATABASE_ID=COLLECTIVE_DB,
             NOTION_NOTIFICATION_CHANNELS=NOTION_NOTIFICATION_CHANNELS,
+            NOTION_DATABASES=[
+                WatchedDatabase(
+                    database_id=normalize_notion_id(COLLECTIVE_DB),
+                    channels=NOTION_NOTIFICATION_CHANNELS,
+                )
+            ],
         )
 
 
@@ -61,7 +196,15 @@ def validate_settings(settings: Settings) -> None:
         raise ValueError("NOTION_TOKEN is required")
     if not settings.DISCORD_BOT_TOKEN:
         raise ValueError("DISCORD_BOT_TOKEN is required")
-    if not settings.NOTION_DATABASE_ID:
-        raise ValueError("NOTION_DATABASE_ID is required")
-    if not settings.NOTION_NOTIFICATION_CHANNELS:
-        raise ValueError("At least one NOTION_NOTIFICATION_CHANNELS value is required")
+    if not settings.NOTION_DATABASES:
+        raise ValueError("NOTION_DATABASE_ID or NOTION_DATABASES is required")
+    for database in settings.NOTION_DATABASES:
+        if not 0 < database.min_interval <= database.max_interval:
+            raise ValueError(
+                f"Poll intervals for {database.database_id} must satisfy 0 < min <= max"
+            )
+        if not database.channels:
+            raise ValueError(
+                "At least one notification channel is required for "
+                f"{database.database_id}"
+            )
@@ -5,17 +5,48 @@ from sqlalchemy import (
     Boolean,
     JSON,
     ForeignKey,
+    Index,
     Integer,
     Table,
+    TypeDecorator,
     func,
 )
 from sqlalchemy.orm import declarative_base, relationship
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 from src.domain.notion.entities import NotionDocument, NotionUser
 import uuid
 
 Base = declarative_base()
 
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware timestamp that always reads back as aware UTC
+
+    SQLite has no timezone type and returns naive values, which cannot be
+    compared with the aware times from the Notion API. Naive values are
+    taken to be UTC.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return _as_utc(value)
+
+    def process_result_value(self, value, dialect):
+        return _as_utc(value)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a timestamp to aware UTC, treating naive values as UTC"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 # Association tables for many-to-many relationships
 document_creators = Table(
     "notion_document_creators",
@@ -47,12 +78,14 @@ class NotionDocumentModel(Base):
 
     id = Column(String(255), primary_key=True)
     object = Column(String(50), nullable=False)
-    created_time = Column(DateTime(timezone=True), nullable=False)
-    last_edited_time = Column(DateTime(timezone=True), nullable=False)
+    created_time = Column(UTCDateTime, nullable=False)
+    last_edited_time = Column(UTCDateTime, nullable=False)
     title = Column(JSON)
     url = Column(String)
     archived = Column(Boolean, default=False)
     properties = Column(JSON)
+    content_hash = Column(String(64), index=True)
+    database_id = Column(String(255), nullable=True, index=True)
     created_by_id = Column(String(255), ForeignKey("notion_users.id"))
     last_edited_by_id = Column(String(255), ForeignKey("notion_users.id"))
 
@@ -75,6 +108,8 @@ class NotionDocumentModel(Base):
             url=self.url,
             archived=self.archived,
             properties=self.properties,
+            content_hash=self.content_hash,
+            database_id=self.database_id,
         )
 
     @classmethod
@@ -92,6 +127,8 @@ class NotionDocumentModel(Base):
             url=entity.url,
             archived=entity.archived,
             properties=entity.properties,
+            content_hash=entity.content_hash,
+            database_id=entity.database_id,
         )
 
     def get_last_update_time(self) -> datetime:
@@ -100,16 +137,27 @@ class NotionDocumentModel(Base):
 
 class NotionDocumentVersionModel(Base):
     __tablename__ = "notion_document_versions"
+    __table_args__ = (
+        Index(
+            "ix_notion_document_versions_document_sequence", "document_id", "sequence"
+        ),
+    )
 
     id = Column(String(255), primary_key=True, default=lambda: str(uuid.uuid4()))
     document_id = Column(String(255), ForeignKey("notion_documents.id"))
+    # Versions are numbered per document. Keyframes store full properties,
+    # every other version stores a JSON Patch against the previous one.
+    sequence = Column(Integer, nullable=True)
+    is_keyframe = Column(Boolean, default=True)
+    delta = Column(JSON, nullable=True)
     object = Column(String(50), nullable=False)
-    created_time = Column(DateTime(timezone=True), nullable=False)
-    last_edited_time = Column(DateTime(timezone=True), nullable=False)
+    created_time = Column(UTCDateTime, nullable=False)
+    last_edited_time = Column(UTCDateTime, nullable=False)
     title = Column(String)
     url = Column(String)
     archived = Column(Boolean, default=False)
     properties = Column(JSON)
+    content_hash = Column(String(64), index=True)
     created_by_id = Column(String(255), ForeignKey("notion_users.id"))
     last_edited_by_id = Column(String(255), ForeignKey("notion_users.id"))
 
@@ -123,7 +171,22 @@ class NotionStateModel(Base):
     __tablename__ = "notion_state"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    last_sync_time = Column(DateTime(timezone=True), nullable=False, default=func.now())
+    last_sync_time = Column(UTCDateTime, nullable=False, default=func.now())
     cursor = Column(String, nullable=True)
     sync_type = Column(String(50), nullable=False)
     status = Column(String(50), nullable=False)
+
+
+class NotionUpdateCooldownModel(Base):
+    __tablename__ = "notion_update_cooldowns"
+
+    document_id = Column(String(255), primary_key=True)
+    notified_at = Column(UTCDateTime, nullable=False, index=True)
+
+
+class NotionLeaseModel(Base):
+    __tablename__ = "notion_leases"
+
+    name = Column(String(255), primary_key=True)
+    holder = Column(String(255), nullable=False)
+    expires_at = Column(UTCDateTime, nullable=False)
@@ -1,9 +1,23 @@
+import os
+import time
+from contextlib import nullcontext
+from typing import ContextManager
 import discord
 from discord import app_commands
 from discord.ext import tasks
 from datetime import datetime, timezone
 from src.application.discord.discord_service import DiscordService
+from src.infrastructure.config.constants import (
+    MIN_POLL_INTERVAL,
+    WEBHOOK_FLUSH_INTERVAL,
+)
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.metrics.instruments import POLL_CYCLE_SECONDS
+from src.infrastructure.metrics.server import MetricsServer
+from src.infrastructure.notion_webhook.server import NotionWebhookServer
+from src.infrastructure.tracing.exporters import create_exporter
+from src.infrastructure.tracing.profiler import SamplingProfiler
+from src.infrastructure.tracing.tracer import TRACER
 from src.utils.logging import logger
 
 
@@ -19,6 +33,32 @@ class DiscordClient(discord.Client):
     ):
         super().__init__(*args, **kwargs)
         self.settings = settings
+        self.webhook_server = None
+        if settings.NOTION_WEBHOOK_ENABLED:
+            self.webhook_server = NotionWebhookServer(
+                settings.NOTION_WEBHOOK_SECRET,
+                discord_service.record_webhook_event,
+                host=settings.NOTION_WEBHOOK_HOST,
+                port=settings.NOTION_WEBHOOK_PORT,
+                path=settings.NOTION_WEBHOOK_PATH,
+            )
+        self.metrics_server = None
+        if settings.METRICS_ENABLED:
+            self.metrics_server = MetricsServer(
+                state=discord_service.get_bot_state,
+                host=settings.METRICS_HOST,
+                port=settings.METRICS_PORT,
+            )
+        if settings.TRACING_ENABLED:
+            TRACER.configure(
+                create_exporter(
+                    settings.TRACE_FORMAT,
+                    settings.TRACE_FILE,
+                    settings.TRACE_OTLP_ENDPOINT,
+                )
+            )
+        self.profiler = SamplingProfiler() if settings.PROFILE_EVERY_N_CYCLES else None
+        self._cycle = 0
         self.tree = app_commands.CommandTree(self)
         discord_service.client = self
         self.discord_service = discord_service
@@ -26,15 +66,26 @@ class DiscordClient(discord.Client):
     async def setup_hook(self) -> None:
         """Set up background tasks when the bot starts"""
         logger.info("Setting up Discord client...")
+        self.check_updates.change_interval(
+            seconds=min(db.min_interval for db in self.settings.NOTION_DATABASES)
+        )
+        self.renew_leases.change_interval(seconds=max(self.settings.LEASE_TTL / 3, 1))
+        self.renew_leases.start()
         self.check_updates.start()
         logger.info("Started check_updates task")
+        if self.webhook_server:
+            await self.webhook_server.start()
+            self.flush_webhook_events.start()
+            logger.info("Started flush_webhook_events task")
+        if self.metrics_server:
+            await self.metrics_server.start()
         logger.info("Discord client setup completed")
 
     async def on_ready(self) -> None:
         """Called when the bot is ready"""
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
 
-        for channel_id in self.settings.NOTION_NOTIFICATION_CHANNELS:
+        for channel_id in self.discord_service.notion_service.notification_channels:
             channel = self.get_channel(channel_id)
             if channel:
                 self.discord_service.register_channel(channel_id)
@@ -49,40 +100,117 @@ class DiscordClient(discord.Client):
                 "No channels were registered successfully. Cannot initialize service."
             )
 
-    @tasks.loop(minutes=2)
+    async def close(self) -> None:
+        """Stop delivery workers before closing the connection"""
+        if self.webhook_server:
+            self.flush_webhook_events.cancel()
+            await self.webhook_server.stop()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        await self.discord_service.dispatcher.close()
+        self.renew_leases.cancel()
+        await self.discord_service.coordinator.release()
+        await TRACER.flush()
+        await super().close()
+
+    @tasks.loop(seconds=10)
+    async def renew_leases(self):
+        """Renew coordination leases several times per lease interval"""
+        try:
+            with TRACER.span("renew_leases"):
+                await self.discord_service.renew_leases()
+        except Exception as e:
+            logger.error(f"Error in renew_leases task: {e}", exc_info=True)
+
+    @tasks.loop(seconds=MIN_POLL_INTERVAL)
     async def check_updates(self):
-        """Check for updates every 2 minutes"""
+        """Check the databases whose poll interval has elapsed
+
+        After each pass the loop is rescheduled for the next database that
+        falls due, so its period follows the adaptive poll intervals.
+        """
+        started = time.monotonic()
+        self._cycle += 1
+        with self._profile_cycle(), TRACER.span("check_updates", cycle=self._cycle):
+            await self._run_update_check()
+        POLL_CYCLE_SECONDS.observe(time.monotonic() - started)
+        await TRACER.flush()
+
+        # The next run is timed from the start of this one
+        delay = self.discord_service.next_check_delay()
+        self.check_updates.change_interval(
+            seconds=max(delay + time.monotonic() - started, 1)
+        )
+        intervals = self.discord_service.notion_service.get_poll_intervals()
+        logger.info(f"Next update check in {delay:.0f}s (poll intervals: {intervals})")
+
+    def _profile_cycle(self) -> ContextManager:
+        """Profile every ``PROFILE_EVERY_N_CYCLES``th update check"""
+        if not self.profiler or self._cycle % self.settings.PROFILE_EVERY_N_CYCLES:
+            return nullcontext()
+        path = os.path.join(
+            self.settings.PROFILE_DIR,
+            f"check_updates-{self._cycle}-{int(time.time())}.folded",
+        )
+        return self.profiler.profile(path)
+
+    async def _run_update_check(self) -> None:
+        """Sync due databases, queue notifications and send the weekly summary"""
         try:
             logger.info("Starting periodic update check...")
 
-            creation_notifications = (
-                await self.discord_service.handle_creation_notifications()
-            )
-            logger.info(f"Found {len(creation_notifications)} new documents")
-            for notification in creation_notifications:
-                await self.discord_service._send_notification(notification)
+            sync_notifications = await self.discord_service.handle_sync_notifications()
+            logger.info(f"Found {len(sync_notifications)} new or updated documents")
+            self.discord_service.queue_notifications(sync_notifications)
 
-            update_notifications = (
-                await self.discord_service.handle_update_notifications()
-            )
-            logger.info(f"Found {len(update_notifications)} updates")
-            for notification in update_notifications:
-                await self.discord_service._send_notification(notification)
-
-            aggregate_notification = (
+            aggregate_notifications = (
                 await self.discord_service.handle_aggregate_updates()
             )
-            if aggregate_notification:
+            if aggregate_notifications:
                 logger.info("Sending weekly summary")
-                await self.discord_service._send_notification(aggregate_notification)
+                self.discord_service.queue_notifications(aggregate_notifications)
 
+            logger.debug(
+                "Notion request stats: "
+                f"{self.discord_service.notion_service.notion_client.get_stats()}"
+            )
+            logger.debug(
+                f"Dispatch stats: {self.discord_service.dispatcher.get_stats()}"
+            )
+            logger.debug(
+                f"Polling databases: {sorted(self.discord_service.coordinator.owned)}"
+            )
             logger.info("Completed periodic update check")
         except Exception as e:
             logger.error(f"Error in check_updates task: {e}", exc_info=True)
 
+    @tasks.loop(seconds=WEBHOOK_FLUSH_INTERVAL)
+    async def flush_webhook_events(self):
+        """Sync the pages reported by webhooks, batching bursts of edits"""
+        try:
+            with TRACER.span("flush_webhook_events"):
+                notifications = (
+                    await self.discord_service.handle_webhook_notifications()
+                )
+                self.discord_service.queue_notifications(notifications)
+            await TRACER.flush()
+        except Exception as e:
+            logger.error(f"Error in flush_webhook_events task: {e}", exc_info=True)
+
+    @flush_webhook_events.before_loop
+    async def before_flush_webhook_events(self):
+        """Wait until the service is initialized before syncing webhook events"""
+        await self.wait_until_ready()
+        await self.discord_service.initialized.wait()
+
     @check_updates.before_loop
     async def before_check_updates(self):
-        """Wait until the bot is ready before starting the task"""
+        """Wait until the service is initialized before starting the task
+
+        Initialization loads the update cooldowns, so a sync pass started any
+        earlier could repeat notifications sent just before a restart.
+        """
         logger.info("Waiting for bot to be ready before starting check_updates task...")
         await self.wait_until_ready()
+        await self.discord_service.initialized.wait()
         logger.info("Bot is ready, starting check_updates task")
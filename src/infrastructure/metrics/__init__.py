@@ -0,0 +1 @@
+"""Metrics registry and HTTP endpoint implementation."""
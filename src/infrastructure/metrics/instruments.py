@@ -0,0 +1,75 @@
+"""Metrics recorded by the sync and delivery pipeline"""
+
+from src.infrastructure.metrics.registry import REGISTRY
+
+POLL_CYCLE_SECONDS = REGISTRY.histogram(
+    "notion_poll_cycle_seconds", "Duration of a whole update check"
+)
+SYNC_PHASE_SECONDS = REGISTRY.histogram(
+    "notion_sync_phase_seconds",
+    "Time spent in each phase of syncing and delivering changes",
+    ["phase"],
+)
+CHANGE_DETECTION_SECONDS = REGISTRY.histogram(
+    "notion_change_detection_seconds",
+    "Time from a page's last_edited_time until the bot detected the change",
+)
+LAST_SUCCESSFUL_SYNC = REGISTRY.gauge(
+    "notion_last_successful_sync_timestamp_seconds",
+    "Unix time of the last completed sync pass of each database",
+    ["database_id"],
+)
+
+PAGES_SKIPPED = REGISTRY.counter(
+    "notion_pages_skipped_total",
+    "Query results not parsed because they matched the stored edit time",
+)
+
+NOTION_REQUESTS = REGISTRY.counter(
+    "notion_api_requests_total", "Notion API calls attempted"
+)
+NOTION_RETRIES = REGISTRY.counter(
+    "notion_api_retries_total", "Notion API calls retried after a failure"
+)
+NOTION_RATE_LIMITED = REGISTRY.counter(
+    "notion_api_rate_limited_total", "Notion API calls answered with a 429"
+)
+NOTION_FAILURES = REGISTRY.counter(
+    "notion_api_failures_total", "Notion API calls that failed for good"
+)
+
+USER_CACHE_LOOKUPS = REGISTRY.counter(
+    "notion_user_cache_lookups_total", "User name lookups by cache result", ["result"]
+)
+USER_CACHE_HIT_RATIO = REGISTRY.gauge(
+    "notion_user_cache_hit_ratio", "Share of user name lookups served from the cache"
+)
+
+DISCORD_MESSAGES = REGISTRY.counter(
+    "discord_messages_total", "Discord messages by delivery outcome", ["result"]
+)
+DISCORD_RETRIES = REGISTRY.counter(
+    "discord_message_retries_total", "Discord sends retried after a failure"
+)
+NOTIFICATION_LATENCY_SECONDS = REGISTRY.histogram(
+    "discord_notification_latency_seconds",
+    "Time from queueing a message until Discord accepted it",
+)
+PENDING_NOTIFICATIONS = REGISTRY.gauge(
+    "discord_pending_messages", "Messages queued for delivery"
+)
+
+DB_POOL_CHECKED_OUT = REGISTRY.gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool",
+    ["driver"],
+)
+
+
+def _user_cache_hit_ratio() -> float:
+    hits = USER_CACHE_LOOKUPS.get(result="hit")
+    lookups = hits + USER_CACHE_LOOKUPS.get(result="miss")
+    return hits / lookups if lookups else 0.0
+
+
+USER_CACHE_HIT_RATIO.set_function(_user_cache_hit_ratio)
@@ -0,0 +1,62 @@
+import json
+from typing import Callable, Optional
+from aiohttp import web
+from src.infrastructure.config.constants import METRICS_PATH, METRICS_PORT
+from src.infrastructure.metrics.registry import REGISTRY, MetricsRegistry
+from src.utils.logging import logger
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """Embedded HTTP endpoint serving metrics for Prometheus to scrape
+
+    ``GET /metrics`` renders the registry in the text exposition format and,
+    when a ``state`` callable is given, ``GET /state`` returns it as JSON.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = REGISTRY,
+        state: Optional[Callable[[], dict]] = None,
+        host: str = "127.0.0.1",
+        port: int = METRICS_PORT,
+        path: str = METRICS_PATH,
+    ):
+        self.registry = registry
+        self.state = state
+        self.host = host
+        self.port = port
+        self.path = path
+        self.app = web.Application()
+        self.app.router.add_get(path, self.handle_metrics)
+        if state:
+            self.app.router.add_get("/state", self.handle_state)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        """Start serving metrics"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Serving metrics on {self.host}:{self.port}{self.path}")
+
+    async def stop(self) -> None:
+        """Stop the HTTP server"""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        """Render every registered metric"""
+        return web.Response(
+            body=self.registry.expose().encode(),
+            headers={"Content-Type": EXPOSITION_CONTENT_TYPE},
+        )
+
+    async def handle_state(self, request: web.Request) -> web.Response:
+        """Return the bot state as JSON"""
+        return web.Response(
+            text=json.dumps(self.state(), default=str, indent=2),
+            content_type="application/json",
+        )
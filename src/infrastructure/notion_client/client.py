@@ -1,45 +1,58 @@
-from typing import List, Optional, Any
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, List, Mapping, Optional
 from datetime import datetime
 from notion_client import AsyncClient
 from src.domain.notion.entities import NotionDocument
+from src.infrastructure.config.constants import MAX_CONCURRENT_USER_REQUESTS
+from src.infrastructure.notion_client.scheduler import (
+    RequestPriority,
+    RequestScheduler,
+)
+from src.infrastructure.tracing.tracer import traced
 from src.utils.logging import logger
+from src.utils.notion_utils import normalize_notion_id, parse_notion_time
 import asyncio
 
 
+@dataclass
+class DocumentBatch:
+    """One page of query results
+
+    ``skipped`` counts pages left unparsed because their edit time was
+    already known. ``newest_id`` and ``newest_edit`` identify the most
+    recently edited page, skipped or not.
+    """
+
+    documents: List[NotionDocument] = field(default_factory=list)
+    skipped: int = 0
+    newest_id: Optional[str] = None
+    newest_edit: Optional[datetime] = None
+
+
 class NotionClient:
-    def __init__(self, auth_token: str, database_id: str):
+    def __init__(
+        self,
+        auth_token: str,
+        database_id: str,
+        max_concurrent_user_requests: int = MAX_CONCURRENT_USER_REQUESTS,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
         self.client = AsyncClient(auth=auth_token)
         self.database_id = database_id
-        self._user_cache = {}
+        self.scheduler = scheduler or RequestScheduler()
+        self._pending_users: Dict[str, asyncio.Future] = {}
+        self._user_semaphore = asyncio.Semaphore(max_concurrent_user_requests)
 
-    async def retry_async(
-        self,
-        coro: Any,
-        *args,
-        retries: int = 3,
-        delay: int = 1,
-        backoff_factor: int = 2,
-        **kwargs,
-    ) -> Any:
-        """Generic retry decorator for async operations"""
-        attempt = 0
-        while attempt < retries:
-            try:
-                return await coro(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"Attempt {attempt + 1} failed with error: {e}")
-                attempt += 1
-                if attempt >= retries:
-                    logger.error(f"All {retries} attempts failed. No more retries.")
-                    raise
-                sleep_time = delay * (backoff_factor ** (attempt - 1))
-                logger.info(f"Retrying in {sleep_time} seconds...")
-                await asyncio.sleep(sleep_time)
+    def get_stats(self) -> dict:
+        """Get request scheduler statistics"""
+        return self.scheduler.get_stats()
 
+    @traced("notion_client.get_document")
     async def get_document(self, document_id: str) -> Optional[NotionDocument]:
         """Fetch a single document from Notion API"""
         try:
-            response = await self.retry_async(
+            response = await self.scheduler.submit(
                 self.client.pages.retrieve, page_id=document_id
             )
             return NotionDocument.from_api_response(response)
@@ -47,39 +60,33 @@ class NotionClient:
             logger.error(f"Error fetching document {document_id}: {e}")
             return None
 
+    @traced("notion_client.get_all_documents")
     async def get_all_documents(self) -> List[NotionDocument]:
         """Fetch all documents from the database"""
         try:
             documents = []
-            has_more = True
-            start_cursor = None
-
-            while has_more:
-                response = await self.retry_async(
-                    self.client.databases.query,
-                    database_id=self.database_id,
-                    start_cursor=start_cursor,
-                )
-
-                documents.extend(
-                    [
-                        NotionDocument.from_api_response(page)
-                        for page in response["results"]
-                    ]
-                )
-
-                has_more = response["has_more"]
-                start_cursor = response["next_cursor"]
-
+            async with aclosing(self.iter_all_documents()) as batches:
+                async for batch in batches:
+                    documents.extend(batch)
             return documents
         except Exception as e:
             logger.error(f"Error fetching all documents: {e}")
             return []
 
+    async def iter_all_documents(self) -> AsyncIterator[List[NotionDocument]]:
+        """Yield all documents from the database one page of results at a time"""
+        async with aclosing(self._paginate(database_id=self.database_id)) as responses:
+            async for response in responses:
+                yield [
+                    NotionDocument.from_api_response(page)
+                    for page in response["results"]
+                ]
+
+    @traced("notion_client.get_recent_documents")
     async def get_recent_documents(self, limit: int = 100) -> List[NotionDocument]:
         """Fetch recent documents from the database"""
         try:
-            response = await self.retry_async(
+            response = await self.scheduler.submit(
                 self.client.databases.query,
                 database_id=self.database_id,
                 page_size=limit,
@@ -93,50 +100,167 @@ class NotionClient:
             logger.error(f"Error fetching recent documents: {e}")
             return []
 
-    async def get_updated_documents(self) -> List[NotionDocument]:
-        """Fetch recently updated documents"""
+    @traced("notion_client.get_updated_documents")
+    async def get_updated_documents(
+        self, since: Optional[datetime] = None, database_id: Optional[str] = None
+    ) -> List[NotionDocument]:
+        """Fetch recently updated documents
+
+        See ``iter_updated_documents``; errors are logged and give an empty
+        list.
+        """
         try:
-            logger.debug("Querying Notion database for updates...")
             documents = []
-            has_more = True
-            start_cursor = None
-
-            while has_more:
-                response = await self.retry_async(
-                    self.client.databases.query,
-                    database_id=self.database_id,
-                    start_cursor=start_cursor,
-                    sorts=[
-                        {"timestamp": "last_edited_time", "direction": "descending"}
+            async with aclosing(
+                self.iter_updated_documents(since, database_id)
+            ) as batches:
+                async for batch in batches:
+                    documents.extend(batch.documents)
+            logger.debug(f"Received total of {len(documents)} results from Notion")
+            return documents
+        except Exception as e:
+            logger.error(
+                "Error fetching updated documents from "
+                f"{database_id or self.database_id}: {e}"
+            )
+            return []
+
+    async def iter_updated_documents(
+        self,
+        since: Optional[datetime] = None,
+        database_id: Optional[str] = None,
+        known_edits: Optional[Mapping[str, str]] = None,
+    ) -> AsyncIterator[DocumentBatch]:
+        """Yield recently updated documents one page of results at a time
+
+        When ``since`` is given only pages edited on or after that high-water
+        mark are requested, and pagination stops as soon as results fall
+        behind it, so a quiet cycle costs a single query. ``database_id``
+        defaults to the client's database. Pages whose raw
+        ``last_edited_time`` equals their entry in ``known_edits`` are
+        counted as skipped without being parsed. Errors reach the caller,
+        after any pages already yielded.
+        """
+        database_id = normalize_notion_id(database_id or self.database_id)
+        logger.debug(f"Querying Notion database {database_id} for updates...")
+        known_edits = known_edits or {}
+        query = {
+            "database_id": database_id,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}],
+        }
+        if since:
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": since.isoformat()},
+            }
+
+        def is_last(response: dict) -> bool:
+            results = response["results"]
+            return bool(
+                since
+                and results
+                and parse_notion_time(results[-1]["last_edited_time"]) < since
+            )
+
+        async with aclosing(self._paginate(is_last, **query)) as responses:
+            async for response in responses:
+                results = response["results"]
+                if not results:
+                    continue
+
+                # Only pages that may have changed are parsed
+                pages = [
+                    page
+                    for page in results
+                    if known_edits.get(page["id"]) != page["last_edited_time"]
+                ]
+                documents = [
+                    NotionDocument.from_api_response(page, database_id=database_id)
+                    for page in pages
+                ]
+                # Results are sorted newest first
+                yield DocumentBatch(
+                    documents=[
+                        doc
+                        for doc in documents
+                        if not since or doc.last_edited_time >= since
                     ],
+                    skipped=len(results) - len(pages),
+                    newest_id=results[0]["id"],
+                    newest_edit=parse_notion_time(results[0]["last_edited_time"]),
                 )
 
-                documents.extend(
-                    [
-                        NotionDocument.from_api_response(page)
-                        for page in response["results"]
-                    ]
+    async def _paginate(
+        self, is_last: Callable[[dict], bool] = lambda response: False, **query
+    ) -> AsyncIterator[dict]:
+        """Yield each response of a database query, prefetching the next one
+
+        The request for the next cursor is in flight while the caller works on
+        the current response, and is cancelled if the caller stops early.
+        """
+        request = asyncio.ensure_future(
+            self.scheduler.submit(self.client.databases.query, **query)
+        )
+        try:
+            while request is not None:
+                response = await request
+                request = None
+                if response["has_more"] and not is_last(response):
+                    request = asyncio.ensure_future(
+                        self.scheduler.submit(
+                            self.client.databases.query,
+                            start_cursor=response["next_cursor"],
+                            **query,
+                        )
+                    )
+                yield response
+        finally:
+            if request is not None:
+                request.cancel()
+                # A prefetch that already failed must not log an unretrieved error
+                request.add_done_callback(
+                    lambda future: future.cancelled() or future.exception()
                 )
 
-                has_more = response["has_more"]
-                start_cursor = response["next_cursor"]
+    async def get_user(self, user_id: str) -> dict:
+        """Fetch a user from the Notion API
 
-            logger.debug(f"Received total of {len(documents)} results from Notion")
-            return documents
-        except Exception as e:
-            logger.error(f"Error fetching updated documents: {e}")
-            return []
+        Concurrent callers asking for the same ID share one in-flight request,
+        and at most ``max_concurrent_user_requests`` lookups run at once.
+        """
+        pending = self._pending_users.get(user_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_user(user_id))
+            self._pending_users[user_id] = pending
+            pending.add_done_callback(lambda _: self._pending_users.pop(user_id, None))
 
-    async def get_user(self, user_id: str) -> dict:
-        """Get user details for a user ID, with caching"""
-        if user_id in self._user_cache:
-            return self._user_cache[user_id]
+        return await asyncio.shield(pending)
 
-        try:
-            user = await self.retry_async(self.client.users.retrieve, user_id=user_id)
-            self._user_cache[user_id] = user.get("name", "Unknown User")
-            return self._user_cache[user_id]
-        except Exception as e:
-            logger.debug(f"Could not fetch user {user_id}, using ID as name: {e}")
-            self._user_cache[user_id] = user_id[:8]
-            return self._user_cache[user_id]
+    @traced("notion_client.get_user")
+    async def _fetch_user(self, user_id: str) -> dict:
+        """Fetch a user under the concurrency limit"""
+        async with self._user_semaphore:
+            return await self.scheduler.submit(
+                self.client.users.retrieve,
+                user_id=user_id,
+                priority=RequestPriority.USER,
+            )
+
+    @traced("notion_client.list_users")
+    async def list_users(self) -> List[dict]:
+        """Fetch every user in the workspace"""
+        users = []
+        has_more = True
+        start_cursor = None
+
+        while has_more:
+            response = await self.scheduler.submit(
+                self.client.users.list,
+                start_cursor=start_cursor,
+                priority=RequestPriority.BACKGROUND,
+            )
+            users.extend(response["results"])
+            has_more = response["has_more"]
+            start_cursor = response["next_cursor"]
+
+        return users
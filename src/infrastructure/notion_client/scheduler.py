@@ -0,0 +1,183 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import httpx
+from src.infrastructure.config.constants import (
+    DEFAULT_RETRY_DELAY,
+    MAX_RETRY_ATTEMPTS,
+    MAX_RETRY_DELAY,
+    NOTION_RATE_BURST,
+    NOTION_RATE_LIMIT,
+)
+from src.infrastructure.metrics.instruments import (
+    NOTION_FAILURES,
+    NOTION_RATE_LIMITED,
+    NOTION_REQUESTS,
+    NOTION_RETRIES,
+)
+from src.infrastructure.tracing.tracer import TRACER
+from src.utils.logging import logger
+from src.utils.rate_limit import TokenBucket
+
+RETRYABLE_STATUSES = {409, 429, 500, 502, 503, 504}
+
+
+class RequestPriority(IntEnum):
+    """Scheduling classes for Notion requests; lower values go first"""
+
+    SYNC = 0
+    USER = 1
+    BACKGROUND = 2
+
+
+class RequestScheduler:
+    """Token-bucket scheduler that every Notion API request goes through
+
+    Requests wait for a token in priority order, so sync queries overtake
+    queued user lookups. A 429 pauses the whole bucket for the server's
+    ``Retry-After``; other retryable failures back off with full jitter.
+    Errors that cannot succeed on retry are raised immediately.
+    """
+
+    def __init__(
+        self,
+        rate: float = NOTION_RATE_LIMIT,
+        burst: int = NOTION_RATE_BURST,
+        max_attempts: int = MAX_RETRY_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_DELAY,
+        max_delay: float = MAX_RETRY_DELAY,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._bucket = TokenBucket(rate, burst)
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "failures": 0,
+            "queue_wait_total": 0.0,
+            "queue_wait_max": 0.0,
+        }
+
+    async def submit(
+        self,
+        func: Callable,
+        *args,
+        priority: RequestPriority = RequestPriority.SYNC,
+        **kwargs,
+    ) -> Any:
+        """Run an API call once a token is available, retrying when allowed"""
+        attempt = 0
+        while True:
+            await self._acquire(priority)
+            try:
+                with TRACER.span(
+                    "notion.request",
+                    endpoint=getattr(func, "__qualname__", repr(func)),
+                    attempt=attempt + 1,
+                ):
+                    return await func(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                retry_after = self._retry_after(e)
+                if retry_after is not None:
+                    self._stats["rate_limited"] += 1
+                    NOTION_RATE_LIMITED.inc()
+                    self._bucket.pause(retry_after)
+
+                if not self._is_retryable(e) or attempt >= self.max_attempts:
+                    self._stats["failures"] += 1
+                    NOTION_FAILURES.inc()
+                    raise
+
+                self._stats["retries"] += 1
+                NOTION_RETRIES.inc()
+                if retry_after is not None:
+                    logger.warning(f"Notion rate limited, retrying in {retry_after}s")
+                    continue
+
+                sleep_time = random.uniform(
+                    0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+                )
+                logger.info(
+                    f"Attempt {attempt} failed with error: {e}. "
+                    f"Retrying in {sleep_time:.2f} seconds..."
+                )
+                await asyncio.sleep(sleep_time)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, retry and queue wait statistics"""
+        requests = self._stats["requests"]
+        return {
+            **self._stats,
+            "queue_wait_avg": (
+                self._stats["queue_wait_total"] / requests if requests else 0.0
+            ),
+            "queue_depth": len(self._waiters),
+            "paused_for": self._bucket.paused_for,
+        }
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        """Wait for a token, behind any higher-priority waiters"""
+        queued_at = time.monotonic()
+        grant = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), grant))
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        await grant
+
+        waited = time.monotonic() - queued_at
+        self._stats["requests"] += 1
+        NOTION_REQUESTS.inc()
+        self._stats["queue_wait_total"] += waited
+        self._stats["queue_wait_max"] = max(self._stats["queue_wait_max"], waited)
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to queued requests until the queue drains"""
+        try:
+            while self._waiters:
+                delay = self._bucket.time_until_token()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                _, _, grant = heapq.heappop(self._waiters)
+                if grant.done():
+                    continue
+                self._bucket.take()
+                grant.set_result(None)
+        finally:
+            self._dispatcher = None
+
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """Get the Retry-After delay of a rate-limited response"""
+        if getattr(error, "status", None) != 429:
+            return None
+
+        headers = getattr(error, "headers", None) or {}
+        try:
+            return float(headers.get("retry-after", self.base_delay))
+        except (TypeError, ValueError):
+            return float(self.base_delay)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Check whether a failed request may succeed if repeated"""
+        status = getattr(error, "status", None)
+        if status is not None:
+            return status in RETRYABLE_STATUSES
+        return isinstance(error, (httpx.TransportError, asyncio.TimeoutError)) or (
+            getattr(error, "code", None) == "notionhq_client_request_timeout"
+        )
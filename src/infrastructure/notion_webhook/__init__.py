@@ -0,0 +1 @@
+"""Notion webhook receiver implementation."""
@@ -0,0 +1,129 @@
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass
+from typing import Callable, Optional
+from aiohttp import web
+from src.infrastructure.config.constants import (
+    WEBHOOK_DELETE_EVENTS,
+    WEBHOOK_PAGE_EVENTS,
+    WEBHOOK_PATH,
+    WEBHOOK_PORT,
+    WEBHOOK_SIGNATURE_HEADER,
+)
+from src.utils.logging import logger
+from src.utils.notion_utils import normalize_notion_id
+
+
+@dataclass
+class NotionWebhookEvent:
+    """A page event delivered by a Notion webhook subscription"""
+
+    type: str
+    page_id: str
+    database_id: Optional[str] = None
+
+    @property
+    def is_deletion(self) -> bool:
+        return self.type in WEBHOOK_DELETE_EVENTS
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> Optional["NotionWebhookEvent"]:
+        """Parse a webhook payload, ignoring events that are not about pages"""
+        event_type = payload.get("type")
+        entity = payload.get("entity") or {}
+        if event_type not in WEBHOOK_PAGE_EVENTS | WEBHOOK_DELETE_EVENTS:
+            return None
+        if entity.get("type") != "page" or not entity.get("id"):
+            return None
+
+        parent = (payload.get("data") or {}).get("parent") or {}
+        database_id = parent.get("id") if parent.get("type") == "database" else None
+        return cls(
+            type=event_type,
+            page_id=entity["id"],
+            database_id=normalize_notion_id(database_id) if database_id else None,
+        )
+
+
+def sign_payload(body: bytes, verification_token: str) -> str:
+    """Compute the ``X-Notion-Signature`` header value for a request body"""
+    digest = hmac.new(verification_token.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(body: bytes, signature: str, verification_token: str) -> bool:
+    """Check a request body against its ``X-Notion-Signature`` header"""
+    if not signature or not verification_token:
+        return False
+    return hmac.compare_digest(sign_payload(body, verification_token), signature)
+
+
+class NotionWebhookServer:
+    """Embedded HTTP endpoint receiving Notion webhook events
+
+    Signed page events are parsed and handed to ``on_event``; the handler
+    only records them, so Notion gets its response immediately. The
+    one-off verification request sent when a subscription is created is
+    logged so its token can be copied into ``NOTION_WEBHOOK_SECRET``.
+    """
+
+    def __init__(
+        self,
+        verification_token: Optional[str],
+        on_event: Callable[[NotionWebhookEvent], None],
+        host: str = "0.0.0.0",
+        port: int = WEBHOOK_PORT,
+        path: str = WEBHOOK_PATH,
+    ):
+        self.verification_token = verification_token
+        self.on_event = on_event
+        self.host = host
+        self.port = port
+        self.path = path
+        self.app = web.Application()
+        self.app.router.add_post(path, self.handle)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        """Start listening for webhook requests"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(
+            f"Listening for Notion webhooks on {self.host}:{self.port}{self.path}"
+        )
+
+    async def stop(self) -> None:
+        """Stop the HTTP server"""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Verify and record a webhook request"""
+        body = await request.read()
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400, text="Invalid JSON")
+        if not isinstance(payload, dict):
+            return web.Response(status=400, text="Expected a JSON object")
+
+        signature = request.headers.get(WEBHOOK_SIGNATURE_HEADER)
+        if "verification_token" in payload and not signature:
+            logger.warning(
+                "Received Notion webhook verification token "
+                f"{payload['verification_token']}; set NOTION_WEBHOOK_SECRET to it"
+            )
+            return web.Response(status=200)
+
+        if not verify_signature(body, signature, self.verification_token):
+            logger.warning("Rejected Notion webhook with an invalid signature")
+            return web.Response(status=401, text="Invalid signature")
+
+        event = NotionWebhookEvent.from_payload(payload)
+        if event:
+            logger.debug(f"Received {event.type} for page {event.page_id}")
+            self.on_event(event)
+        return web.Response(status=200)
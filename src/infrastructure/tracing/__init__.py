@@ -0,0 +1 @@
+"""Tracing spans, trace exporters and the sampling profiler."""
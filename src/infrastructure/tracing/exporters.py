@@ -0,0 +1,136 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+import aiohttp
+from src.infrastructure.config.constants import (
+    TRACE_FORMAT_JSON,
+    TRACE_FORMAT_OTLP,
+)
+from src.infrastructure.tracing.tracer import Span
+
+SERVICE_NAME = "notion-discord-bot"
+OTLP_STATUS_OK = 1
+OTLP_STATUS_ERROR = 2
+OTLP_SPAN_KIND_INTERNAL = 1
+
+
+def _append_lines(path: str, lines: List[str]) -> None:
+    with open(path, "a") as f:
+        f.writelines(line + "\n" for line in lines)
+
+
+class JsonSpanExporter:
+    """Append finished spans to a file as JSON lines"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    async def export(self, spans: List[Span]) -> None:
+        lines = [json.dumps(self.to_dict(span), default=str) for span in spans]
+        await asyncio.to_thread(_append_lines, self.path, lines)
+
+    @staticmethod
+    def to_dict(span: Span) -> Dict[str, Any]:
+        return {
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start_time_ns": span.start_time_ns,
+            "duration_ms": round(span.duration_ms, 3),
+            "attributes": span.attributes,
+            "error": span.error,
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpJsonExporter:
+    """Export spans as OTLP/HTTP JSON ``ExportTraceServiceRequest`` bodies
+
+    Requests are POSTed to ``endpoint`` (an OpenTelemetry collector's
+    ``/v1/traces``) when one is given, and appended to ``path`` as one
+    request per line otherwise.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        service_name: str = SERVICE_NAME,
+    ):
+        if not path and not endpoint:
+            raise ValueError("OtlpJsonExporter needs a path or an endpoint")
+        self.path = path
+        self.endpoint = endpoint
+        self.service_name = service_name
+
+    async def export(self, spans: List[Span]) -> None:
+        body = self.to_request(spans)
+        if self.endpoint:
+            async with aiohttp.ClientSession() as session:
+                async with session.post(self.endpoint, json=body) as response:
+                    response.raise_for_status()
+        else:
+            await asyncio.to_thread(_append_lines, self.path, [json.dumps(body)])
+
+    def to_request(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": self.service_name},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "notion_discord_bot"},
+                            "spans": [self._to_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _to_span(self, span: Span) -> Dict[str, Any]:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": OTLP_SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in span.attributes.items()
+            ],
+            "status": (
+                {"code": OTLP_STATUS_ERROR, "message": span.error}
+                if span.error
+                else {"code": OTLP_STATUS_OK}
+            ),
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return otlp_span
+
+
+def create_exporter(trace_format: str, path: str, endpoint: Optional[str] = None):
+    """Build the exporter for a ``TRACE_FORMAT`` setting"""
+    if trace_format == TRACE_FORMAT_JSON:
+        return JsonSpanExporter(path)
+    if trace_format == TRACE_FORMAT_OTLP:
+        return OtlpJsonExporter(path=path, endpoint=endpoint)
+    raise ValueError(f"Unknown trace format: {trace_format}")
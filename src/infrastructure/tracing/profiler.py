@@ -0,0 +1,69 @@
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from src.infrastructure.config.constants import PROFILE_SAMPLE_INTERVAL
+from src.utils.logging import logger
+
+
+class SamplingProfiler:
+    """Sample a thread's stack on a timer and write collapsed stacks
+
+    A background thread records the target thread's Python stack every
+    ``interval`` seconds. The output has one ``outer;...;inner count`` line
+    per distinct stack, the input format of flamegraph.pl and speedscope.
+    Time the event loop spends waiting shows up under its ``select`` call.
+    """
+
+    def __init__(self, interval: float = PROFILE_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._root = os.getcwd() + os.sep
+
+    @contextmanager
+    def profile(self, path: str, thread_id: Optional[int] = None) -> Iterator[Counter]:
+        """Sample ``thread_id`` (the calling thread) while the block runs"""
+        thread_id = thread_id or threading.get_ident()
+        stacks: Counter = Counter()
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(thread_id, stacks, stop),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        sampler.start()
+        try:
+            yield stacks
+        finally:
+            stop.set()
+            sampler.join()
+            self._write(path, stacks)
+
+    def _sample(self, thread_id: int, stacks: Counter, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            names = []
+            while frame is not None:
+                names.append(self._describe(frame))
+                frame = frame.f_back
+            if names:
+                stacks[";".join(reversed(names))] += 1
+
+    def _describe(self, frame) -> str:
+        code = frame.f_code
+        filename = code.co_filename
+        if filename.startswith(self._root):
+            filename = filename[len(self._root) :]
+        return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+    def _write(self, path: str, stacks: Counter) -> None:
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            logger.info(f"Wrote {sum(stacks.values())} profile samples to {path}")
+        except OSError as e:
+            logger.error(f"Could not write profile to {path}: {e}")
@@ -0,0 +1,127 @@
+import functools
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from src.utils.logging import logger
+
+
+@dataclass
+class Span:
+    """A timed operation, nested under the span that was current when it began"""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_time_ns or time.time_ns()
+        return (end - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class Tracer:
+    """Record spans for the current task and hand finished ones to an exporter
+
+    The current span lives in a context variable, so spans opened inside a
+    task nest under the span that was current when the task was created.
+    Work that outlives its cycle, such as queued Discord sends, passes the
+    span it belongs to as ``parent`` explicitly. Finished spans are buffered
+    until ``flush``. While disabled, ``span`` yields ``None`` and records
+    nothing.
+    """
+
+    def __init__(self, exporter=None, max_buffered: int = 10000):
+        self.exporter = exporter
+        self.max_buffered = max_buffered
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            "current_span", default=None
+        )
+        self._finished: List[Span] = []
+        self._dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter) -> None:
+        """Start exporting spans through ``exporter``, or stop with ``None``"""
+        self.exporter = exporter
+
+    def current_span(self) -> Optional[Span]:
+        return self._current.get()
+
+    @contextmanager
+    def span(
+        self, name: str, parent: Optional[Span] = None, **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        """Time the enclosed block as a child of ``parent`` or the current span"""
+        if not self.enabled:
+            yield None
+            return
+
+        parent = parent or self._current.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_time_ns = time.time_ns()
+            self._current.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        if len(self._finished) >= self.max_buffered:
+            self._dropped += 1
+            return
+        self._finished.append(span)
+
+    async def flush(self) -> None:
+        """Export the spans finished since the last flush"""
+        if not self.enabled or not self._finished:
+            return
+
+        spans, self._finished = self._finished, []
+        if self._dropped:
+            logger.warning(f"Dropped {self._dropped} spans; flush more often")
+            self._dropped = 0
+        try:
+            await self.exporter.export(spans)
+        except Exception as e:
+            logger.error(f"Could not export {len(spans)} spans: {e}")
+
+
+TRACER = Tracer()
+
+
+def traced(name: str) -> Callable:
+    """Wrap a coroutine function in a span named ``name``"""
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            with TRACER.span(name):
+                return await function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
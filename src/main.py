@@ -1,34 +1,72 @@
 import asyncio
 import discord
-from src.infrastructure.config.database import engine, create_session
+from src.infrastructure.config.database import (
+    engine,
+    create_session,
+    create_async_session,
+    is_postgres_url,
+)
 from src.infrastructure.config.settings import load_environment, Settings
 from src.infrastructure.notion_client.client import NotionClient
 from src.infrastructure.discord_client.client import DiscordClient
-from src.domain.notion.repositories import SQLNotionRepository
+from src.domain.notion.repositories import (
+    AsyncNotionRepository,
+    AsyncSQLNotionRepository,
+    SQLNotionRepository,
+    ThreadedNotionRepository,
+)
+from src.application.notion.coordinator import LeaseCoordinator
 from src.application.notion.notion_service import NotionService
+from src.application.notion.user_directory import UserDirectory
 from src.application.discord.discord_service import DiscordService
 from src.utils.logging import logger
 
 
+def setup_notion_repository(
+    settings: Settings, session_factory
+) -> AsyncNotionRepository:
+    """Setup the repository used from the event loop"""
+    if settings.ASYNC_DATABASE and is_postgres_url(settings.DATABASE_URL):
+        logger.info("Using asyncpg database driver")
+        return AsyncSQLNotionRepository(create_async_session())
+    if settings.ASYNC_DATABASE:
+        logger.warning(
+            "ASYNC_DATABASE needs PostgreSQL; running database calls in worker threads"
+        )
+
+    logger.info("Using the sync database driver in worker threads")
+    return ThreadedNotionRepository(SQLNotionRepository(session_factory))
+
+
 def setup_discord_service(
     settings: Settings, session_factory
 ) -> tuple[DiscordService, DiscordClient]:
     """Setup Discord service and client"""
 
-    notion_client = NotionClient(settings.NOTION_TOKEN, settings.NOTION_DATABASE_ID)
-    notion_repository = SQLNotionRepository(session_factory)
+    notion_client = NotionClient(
+        settings.NOTION_TOKEN, settings.NOTION_DATABASES[0].database_id
+    )
+    notion_repository = setup_notion_repository(settings, session_factory)
 
     notion_service = NotionService(
         notion_client=notion_client,
         notion_repository=notion_repository,
         notification_channels=settings.NOTION_NOTIFICATION_CHANNELS,
         update_cooldown=settings.UPDATE_COOLDOWN,
+        user_directory=UserDirectory(notion_client, notion_repository),
+        databases=settings.NOTION_DATABASES,
     )
 
     discord_service = DiscordService(
         notion_service=notion_service,
         settings=settings,
         check_interval=settings.UPDATE_INTERVAL,
+        coordinator=LeaseCoordinator(
+            notion_repository,
+            settings.NOTION_DATABASES,
+            mode=settings.COORDINATION_MODE,
+            lease_ttl=settings.LEASE_TTL,
+        ),
     )
 
     discord_client = DiscordClient(
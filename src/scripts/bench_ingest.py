@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""Track the per-page cost of the ingest hot path against a saved baseline.
+
+Measures ns/page, the tracemalloc peak in bytes/page and the blocks and
+bytes/page still held afterwards for parsing pages
+(``NotionDocument.from_api_response``, ``extract_title``,
+``compute_content_hash``), skipping already stored pages by their edit time,
+and mapping pages to and from rows
+(``NotionDocumentModel.from_entity``/``to_entity``) at each size in
+BENCHMARK_SIZES. ``document_footprint`` parses freshly decoded response
+bodies, as the client does, so its bytes held are the memory per document.
+When BENCHMARK_DATABASE_URL points at a scratch PostgreSQL database, the
+full sync loop (``NotionService.handle_sync`` over the fake Notion API) is
+measured too, for a baseline pass, a pass returning only pages already
+stored and a pass where every page changed. Without it the ``sync_*``
+entries are skipped, and listed as not measured when comparing.
+
+    python -m src.scripts.bench_ingest          # compare with the baseline
+    python -m src.scripts.bench_ingest --save   # record a new baseline
+
+Results more than BENCHMARK_TOLERANCE slower, or peaking at or holding that
+many more bytes, than BENCHMARK_BASELINE are flagged and the script exits
+with status 1. Allocations per page are not counted: tracemalloc only sees
+the blocks still held when a run ends, not those allocated and freed along
+the way, so a run that allocates heavily and frees everything shows up in
+its peak instead.
+Compare baselines recorded on the same machine only.
+"""
+
+import asyncio
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+from sqlalchemy.engine import make_url
+from src.domain.notion.entities import NotionDocument
+from src.infrastructure.database.models import Base, NotionDocumentModel
+from src.scripts.fake_notion import FakeAsyncClient
+from src.scripts.synthetic import make_pages
+from src.utils.logging import logger
+from src.utils.notion_utils import compute_content_hash, extract_title
+
+DEFAULT_BASELINE = "benchmarks/ingest_baseline.json"
+TRACKED_PACKAGES = ["SQLAlchemy", "asyncpg", "notion-client", "discord.py"]
+
+
+@dataclass
+class BenchmarkResult:
+    """Per-page cost of one benchmark at one size"""
+
+    ns_per_page: float
+    blocks_held_per_page: float
+    bytes_per_page: float
+    retained_bytes_per_page: float = 0.0
+
+
+@contextmanager
+def traced_memory(count: int) -> Iterator[Dict[str, float]]:
+    """Record the blocks and bytes still held afterwards, and the peak"""
+    stats: Dict[str, float] = {}
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    # Snapshots are traced too, so leave them out of the peak
+    tracemalloc.reset_peak()
+    try:
+        yield stats
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    differences = after.compare_to(before, "lineno")
+    blocks = sum(stat.count_diff for stat in differences)
+    retained = sum(stat.size_diff for stat in differences)
+    stats["blocks_held_per_page"] = max(blocks, 0) / count
+    stats["bytes_per_page"] = peak / count
+    stats["retained_bytes_per_page"] = max(retained, 0) / count
+
+
+def measure(count: int, run: Callable[[], Any], repeat: int) -> BenchmarkResult:
+    """Time the best of ``repeat`` runs, then trace one for memory"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    with traced_memory(count) as memory:
+        # Keep the output alive until the snapshot so its blocks are counted
+        output = run()
+    del output
+    return BenchmarkResult(ns_per_page=best / count, **memory)
+
+
+def bench_parsing(sizes: List[int], repeat: int) -> Dict[str, BenchmarkResult]:
+    """Measure page parsing and row mapping at each size"""
+    results = {}
+    for size in sizes:
+        pages = make_pages(size)
+        bodies = [json.dumps(page) for page in pages]
+        documents = [NotionDocument.from_api_response(page) for page in pages]
+        models = [NotionDocumentModel.from_entity(doc) for doc in documents]
+        properties = [doc.properties for doc in documents]
+        known_edits = {page["id"]: page["last_edited_time"] for page in pages}
+
+        cases = {
+            "from_api_response": lambda: [
+                NotionDocument.from_api_response(page) for page in pages
+            ],
+            "document_footprint": lambda: [
+                NotionDocument.from_api_response(json.loads(body)) for body in bodies
+            ],
+            "known_edit_filter": lambda: [
+                page
+                for page in pages
+                if known_edits.get(page["id"]) != page["last_edited_time"]
+            ],
+            "extract_title": lambda: [extract_title(page) for page in pages],
+            "compute_content_hash": lambda: [
+                compute_content_hash(doc.title, props, doc.archived)
+                for doc, props in zip(documents, properties)
+            ],
+            "from_entity": lambda: [
+                NotionDocumentModel.from_entity(doc) for doc in documents
+            ],
+            "to_entity": lambda: [model.to_entity() for model in models],
+        }
+        for name, run in cases.items():
+            results[f"{name}[{size}]"] = result = measure(size, run, repeat)
+            _print_result(f"{name}[{size}]", result)
+    return results
+
+
+async def bench_sync_loop(
+    database_url: str, sizes: List[int]
+) -> Dict[str, BenchmarkResult]:
+    """Measure full sync passes through the fake Notion API and the database"""
+    url = make_url(database_url)
+    sync_url = url.set(drivername="postgresql+psycopg2")
+    # Loading settings needs database configuration, so only the loop imports it
+    os.environ.setdefault(
+        "DATABASE_URL", sync_url.render_as_string(hide_password=False)
+    )
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from src.application.notion.notion_service import NotionService
+    from src.domain.notion.repositories import AsyncSQLNotionRepository
+    from src.infrastructure.config.settings import WatchedDatabase
+    from src.infrastructure.notion_client.client import NotionClient
+    from src.infrastructure.notion_client.scheduler import RequestScheduler
+
+    engine = create_engine(sync_url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    async_engine = create_async_engine(url.set(drivername="postgresql+asyncpg"))
+    repository = AsyncSQLNotionRepository(
+        async_sessionmaker(async_engine, expire_on_commit=False)
+    )
+
+    async def run_passes(size: int, trace: bool) -> Dict[str, Dict[str, float]]:
+        """Run a baseline pass, a pass where nothing changed and one where all did"""
+        notion_api = FakeAsyncClient()
+        database = WatchedDatabase(
+            database_id=notion_api.add_database(size), channels=[1]
+        )
+        notion_client = NotionClient(
+            "benchmark",
+            database.database_id,
+            scheduler=RequestScheduler(rate=1_000_000, burst=1_000_000),
+        )
+        notion_client.client = notion_api
+        service = NotionService(
+            notion_client,
+            repository,
+            database.channels,
+            update_cooldown=0,
+            databases=[database],
+        )
+        await service.initialize()
+
+        measurements = {}
+        for name in ("sync_baseline", "sync_unchanged", "sync_changed"):
+            if name == "sync_unchanged":
+                # As when a deferred page holds the watermark back, every page
+                # is returned again and each is already known to be stored
+                service.edit_indexes[database.database_id].record(
+                    await notion_client.get_all_documents(), datetime.now(timezone.utc)
+                )
+                await repository.save_sync_watermark(
+                    service._watermark_type(database),
+                    datetime(2000, 1, 1, tzinfo=timezone.utc),
+                )
+            if name == "sync_changed":
+                notion_api.edit_pages(size)
+            measurements[name] = await _measure_pass(
+                size, lambda: service.handle_sync([database]), trace
+            )
+        return measurements
+
+    results = {}
+    try:
+        for size in sizes:
+            timed = await run_passes(size, trace=False)
+            traced = await run_passes(size, trace=True)
+            for name in timed:
+                key = f"{name}[{size}]"
+                results[key] = result = BenchmarkResult(**timed[name], **traced[name])
+                _print_result(key, result)
+    finally:
+        await async_engine.dispose()
+    return results
+
+
+async def _measure_pass(
+    count: int, run: Callable[[], Awaitable[Any]], trace: bool
+) -> Dict[str, float]:
+    """Time one sync pass, or trace its memory"""
+    gc.collect()
+    if not trace:
+        started = time.perf_counter_ns()
+        await run()
+        return {"ns_per_page": (time.perf_counter_ns() - started) / count}
+
+    with traced_memory(count) as memory:
+        await run()
+    return memory
+
+
+def _print_result(name: str, result: BenchmarkResult) -> None:
+    print(
+        f"{name:<32} {result.ns_per_page:>12,.0f} ns/page  "
+        f"{result.bytes_per_page:>10,.0f} B/page peak  "
+        f"{result.retained_bytes_per_page:>8,.0f} B/page held  "
+        f"{result.blocks_held_per_page:>8.1f} blocks/page held"
+    )
+
+
+def environment() -> Dict[str, str]:
+    """Describe the interpreter and dependency versions behind a run"""
+    versions = {}
+    for package in TRACKED_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = "not installed"
+    return {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **versions,
+    }
+
+
+def compare(
+    results: Dict[str, BenchmarkResult], baseline: dict, tolerance: float
+) -> List[str]:
+    """Print changes against a baseline and return the regressed benchmarks"""
+    print(f"\nBaseline recorded {baseline['environment'].get('recorded_at')}")
+    changed = {
+        key: value
+        for key, value in environment().items()
+        if key != "recorded_at" and baseline["environment"].get(key) != value
+    }
+    if changed:
+        print(f"Environment differs from the baseline: {changed}")
+
+    missing = sorted(set(baseline["results"]) - set(results))
+    if missing:
+        print(f"Not measured in this run: {', '.join(missing)}")
+
+    regressions = []
+    for name, result in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+
+        time_ratio = result.ns_per_page / previous["ns_per_page"]
+        peak_ratio = (result.bytes_per_page + 1) / (previous["bytes_per_page"] + 1)
+        # Baselines recorded before bytes held were tracked compare as unchanged
+        held_ratio = (result.retained_bytes_per_page + 1) / (
+            previous.get("retained_bytes_per_page", result.retained_bytes_per_page) + 1
+        )
+        regressed = max(time_ratio, peak_ratio, held_ratio) > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<32} time {time_ratio - 1:>+7.1%}  "
+            f"peak {peak_ratio - 1:>+7.1%}  "
+            f"held {held_ratio - 1:>+7.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def run_benchmarks(
+    sizes: List[int],
+    repeat: int,
+    database_url: Optional[str],
+    baseline_path: str,
+    tolerance: float,
+    save: bool,
+) -> int:
+    """Run every benchmark, then save or compare against the baseline"""
+    logger.setLevel("WARNING")
+    results = bench_parsing(sizes, repeat)
+    if database_url and make_url(database_url).get_backend_name() == "postgresql":
+        results.update(asyncio.run(bench_sync_loop(database_url, sizes)))
+    else:
+        print("Skipping the sync loop; set BENCHMARK_DATABASE_URL to PostgreSQL")
+
+    if save:
+        os.makedirs(os.path.dirname(baseline_path) or ".", exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(
+                {
+                    "environment": environment(),
+                    "results": {
+                        name: asdict(result) for name, result in results.items()
+                    },
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+        print(f"\nSaved baseline to {baseline_path}")
+        return 0
+
+    if not os.path.exists(baseline_path):
+        print(f"\nNo baseline at {baseline_path}; run with --save to record one")
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} benchmarks regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(
+        run_benchmarks(
+            sizes=[
+                int(size)
+                for size in os.getenv("BENCHMARK_SIZES", "1000,10000,100000").split(",")
+            ],
+            repeat=int(os.getenv("BENCHMARK_REPEAT", "3")),
+            database_url=os.getenv("BENCHMARK_DATABASE_URL"),
+            baseline_path=os.getenv("BENCHMARK_BASELINE", DEFAULT_BASELINE),
+            tolerance=float(os.getenv("BENCHMARK_TOLERANCE", "0.2")),
+            save="--save" in sys.argv[1:],
+        )
+    )
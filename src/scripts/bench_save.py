@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Compare per-document and bulk write throughput of SQLNotionRepository.
+
+Runs against BENCHMARK_DATABASE_URL (an in-memory SQLite database by
+default). Tables are created if missing and the synthetic rows are removed
+afterwards, but do not point this at the production database.
+"""
+
+import os
+import time
+from typing import Callable, List
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker, Session
+from src.domain.notion.entities import NotionDocument
+from src.domain.notion.repositories import SQLNotionRepository
+from src.infrastructure.database.models import (
+    Base,
+    NotionDocumentModel,
+    NotionDocumentVersionModel,
+)
+from src.scripts.synthetic import make_pages
+
+
+def _clear(session_factory: sessionmaker, documents: List[NotionDocument]) -> None:
+    """Remove the benchmark documents and their versions"""
+    ids = [doc.id for doc in documents]
+    with session_factory() as session:
+        session.execute(
+            delete(NotionDocumentVersionModel).where(
+                NotionDocumentVersionModel.document_id.in_(ids)
+            )
+        )
+        session.execute(
+            delete(NotionDocumentModel).where(NotionDocumentModel.id.in_(ids))
+        )
+        session.commit()
+
+
+def _measure(label: str, count: int, run: Callable[[], None]) -> float:
+    """Time a write path and print its throughput"""
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed
+    print(f"{label:<28} {count:>7} docs  {elapsed:8.3f}s  {rate:10.0f} rows/sec")
+    return rate
+
+
+def run_benchmark(database_url: str, count: int) -> None:
+    """Insert and then update ``count`` documents through both write paths"""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(engine, class_=Session, expire_on_commit=False)
+    repository = SQLNotionRepository(session_factory)
+    documents = [NotionDocument.from_api_response(page) for page in make_pages(count)]
+
+    print(f"Database: {engine.url.render_as_string(hide_password=True)}")
+    try:
+        per_row_insert = _measure(
+            "save_document (insert)",
+            count,
+            lambda: [repository.save_document(doc) for doc in documents],
+        )
+        _clear(session_factory, documents)
+        bulk_insert = _measure(
+            "save_documents_bulk (insert)",
+            count,
+            lambda: repository.save_documents_bulk(documents),
+        )
+        per_row_update = _measure(
+            "save_document (update)",
+            count,
+            lambda: [repository.save_document(doc) for doc in documents],
+        )
+        bulk_update = _measure(
+            "save_documents_bulk (update)",
+            count,
+            lambda: repository.save_documents_bulk(documents),
+        )
+        print(f"Insert speedup: {bulk_insert / per_row_insert:.1f}x")
+        print(f"Update speedup: {bulk_update / per_row_update:.1f}x")
+    finally:
+        _clear(session_factory, documents)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        os.getenv("BENCHMARK_DATABASE_URL", "sqlite://"),
+        int(os.getenv("BENCHMARK_DOCUMENTS", "2000")),
+    )
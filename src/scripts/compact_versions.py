@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+from sqlalchemy import select
+from src.infrastructure.config.constants import VERSION_KEYFRAME_INTERVAL
+from src.infrastructure.config.database import create_session
+from src.infrastructure.database.models import NotionDocumentVersionModel
+from src.utils.json_patch import apply_patch, make_patch
+from src.utils.logging import logger
+
+
+def compact_document_versions(session, document_id: str) -> int:
+    """Renumber a document's versions and delta-encode all but the keyframes"""
+    versions = (
+        session.execute(
+            select(NotionDocumentVersionModel)
+            .where(NotionDocumentVersionModel.document_id == document_id)
+            .order_by(
+                NotionDocumentVersionModel.sequence.is_not(None),
+                NotionDocumentVersionModel.sequence,
+                NotionDocumentVersionModel.last_edited_time,
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    # Materialize every version first; rows may already be delta-encoded
+    full_properties = []
+    previous = None
+    for version in versions:
+        if version.properties is not None or version.delta is None:
+            previous = version.properties
+        else:
+            previous = apply_patch(previous, version.delta)
+        full_properties.append(previous)
+
+    converted = 0
+    for sequence, (version, properties) in enumerate(zip(versions, full_properties)):
+        version.sequence = sequence
+        if sequence % VERSION_KEYFRAME_INTERVAL == 0:
+            version.is_keyframe = True
+            version.properties = properties
+            version.delta = None
+        else:
+            if version.properties is not None:
+                converted += 1
+            version.is_keyframe = False
+            version.properties = None
+            version.delta = make_patch(full_properties[sequence - 1], properties)
+
+    return converted
+
+
+def compact_versions():
+    """Delta-encode stored document versions, keeping periodic keyframes"""
+    session_factory = create_session()
+
+    with session_factory() as session:
+        document_ids = (
+            session.execute(select(NotionDocumentVersionModel.document_id).distinct())
+            .scalars()
+            .all()
+        )
+
+    logger.info(f"Compacting versions for {len(document_ids)} documents")
+    converted = 0
+    for document_id in document_ids:
+        with session_factory() as session:
+            with session.begin():
+                converted += compact_document_versions(session, document_id)
+
+    logger.info(f"Converted {converted} full versions to deltas")
+
+
+if __name__ == "__main__":
+    compact_versions()
@@ -0,0 +1,71 @@
+"""In-process fake of the Discord channels the bot sends to, for load tests."""
+
+import asyncio
+import random
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+class FakeChannel:
+    """Channel that records messages instead of sending them
+
+    Each send waits ``latency`` seconds and raises ``OSError`` with
+    probability ``failure_rate``, which the dispatcher retries.
+    """
+
+    def __init__(
+        self,
+        channel_id: int,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.id = channel_id
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.messages: List[str] = []
+        self.sent_at: List[float] = []
+        self.failures = 0
+        self._random = rng or random.Random()
+
+    async def send(self, content: str = None, **kwargs) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            self.failures += 1
+            raise OSError(f"Simulated send failure on channel {self.id}")
+        self.messages.append(content)
+        self.sent_at.append(time.monotonic())
+
+
+class FakeChannelRegistry:
+    """Replacement for ``DiscordClient.get_channel`` serving fake channels
+
+    Assign ``registry.get_channel`` over the client's method; unknown IDs
+    return ``None`` just as they do for a real client.
+    """
+
+    def __init__(
+        self,
+        channel_ids: Iterable[int],
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        rng = random.Random(seed)
+        self.channels: Dict[int, FakeChannel] = {
+            channel_id: FakeChannel(channel_id, latency, failure_rate, rng)
+            for channel_id in channel_ids
+        }
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of messages delivered and failed across channels"""
+        return {
+            "messages": sum(
+                len(channel.messages) for channel in self.channels.values()
+            ),
+            "failures": sum(channel.failures for channel in self.channels.values()),
+        }
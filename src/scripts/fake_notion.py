@@ -0,0 +1,310 @@
+"""In-process fake of the Notion API endpoints the bot calls, for load tests."""
+
+import asyncio
+import random
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.scripts.synthetic import isoformat, make_page, make_user, make_user_id
+from src.utils.notion_utils import normalize_notion_id
+
+MAX_PAGE_SIZE = 100
+TIMESTAMP_OPERATORS = {
+    "equals": lambda value, bound: value == bound,
+    "before": lambda value, bound: value < bound,
+    "after": lambda value, bound: value > bound,
+    "on_or_before": lambda value, bound: value <= bound,
+    "on_or_after": lambda value, bound: value >= bound,
+}
+
+
+class FakeNotionAPIError(Exception):
+    """Error response carrying the attributes the request scheduler inspects"""
+
+    def __init__(
+        self, status: int, code: str, message: str, retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.headers = {"retry-after": str(retry_after)} if retry_after else {}
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class _Endpoint:
+    def __init__(self, api: "FakeAsyncClient"):
+        self.api = api
+
+
+class _DatabasesEndpoint(_Endpoint):
+    async def query(
+        self,
+        database_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        filter: Optional[dict] = None,
+        sorts: Optional[List[dict]] = None,
+        **kwargs,
+    ) -> dict:
+        await self.api._request("databases.query")
+        rows, positions = self.api._view(database_id, filter, sorts)
+        start = 0
+        if start_cursor:
+            if start_cursor not in positions:
+                raise FakeNotionAPIError(
+                    400, "validation_error", f"Invalid start_cursor: {start_cursor}"
+                )
+            start = positions[start_cursor]
+
+        end = start + min(page_size, MAX_PAGE_SIZE)
+        results = rows[start:end]
+        self.api.pages_served += len(results)
+        has_more = end < len(rows)
+        return {
+            "object": "list",
+            "results": results,
+            "has_more": has_more,
+            "next_cursor": rows[end]["id"] if has_more else None,
+        }
+
+
+class _PagesEndpoint(_Endpoint):
+    async def retrieve(self, page_id: str, **kwargs) -> dict:
+        await self.api._request("pages.retrieve")
+        page = self.api._pages.get(normalize_notion_id(page_id))
+        if page is None:
+            raise FakeNotionAPIError(
+                404, "object_not_found", f"Could not find page with ID: {page_id}"
+            )
+        self.api.pages_served += 1
+        return page
+
+
+class _UsersEndpoint(_Endpoint):
+    async def retrieve(self, user_id: str, **kwargs) -> dict:
+        await self.api._request("users.retrieve")
+        user = self.api._users.get(user_id)
+        if user is None:
+            raise FakeNotionAPIError(
+                404, "object_not_found", f"Could not find user with ID: {user_id}"
+            )
+        return user
+
+    async def list(
+        self,
+        start_cursor: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        **kwargs,
+    ) -> dict:
+        await self.api._request("users.list")
+        users = list(self.api._users.values())
+        start = int(start_cursor or 0)
+        end = start + min(page_size, MAX_PAGE_SIZE)
+        has_more = end < len(users)
+        return {
+            "object": "list",
+            "results": users[start:end],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+
+class FakeAsyncClient:
+    """Stand-in for ``notion_client.AsyncClient`` backed by synthetic workspaces
+
+    Implements ``databases.query`` (cursor pagination, timestamp filters and
+    sorts), ``pages.retrieve``, ``users.retrieve`` and ``users.list``. Every
+    call waits ``latency`` seconds plus up to ``jitter``, and fails with a
+    429 and a ``Retry-After`` of ``retry_after`` seconds with probability
+    ``rate_limit_rate``, so the request scheduler throttles and retries as
+    it would against Notion. Results are the stored page dicts, not copies.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.databases = _DatabasesEndpoint(self)
+        self.pages = _PagesEndpoint(self)
+        self.users = _UsersEndpoint(self)
+
+        self.calls: Counter = Counter()
+        self.rate_limited = 0
+        self.pages_served = 0
+
+        self._random = random.Random(seed)
+        self._databases: Dict[str, List[dict]] = {}
+        self._pages: Dict[str, dict] = {}
+        self._times: Dict[str, Dict[str, datetime]] = {}
+        self._users: Dict[str, dict] = {}
+        self._views: Dict[str, Tuple[List[dict], Dict[str, int]]] = {}
+        self._edits = 0
+
+    def add_database(
+        self,
+        page_count: int,
+        database_id: Optional[str] = None,
+        user_count: int = 20,
+    ) -> str:
+        """Create a database of ``page_count`` synthetic pages and return its ID"""
+        database_id = normalize_notion_id(database_id or str(uuid.uuid4()))
+        for index in range(user_count):
+            self._users.setdefault(make_user_id(index), make_user(index))
+
+        rows = self._databases.setdefault(database_id, [])
+        for index in range(len(rows), len(rows) + page_count):
+            page = make_page(index, user_count=user_count, database_id=database_id)
+            rows.append(page)
+            self._index(page)
+        self._views.clear()
+        return database_id
+
+    def edit_pages(self, count: int, database_id: Optional[str] = None) -> List[str]:
+        """Edit ``count`` random pages now, returning their IDs"""
+        rows = (
+            self._databases[normalize_notion_id(database_id)]
+            if database_id
+            else list(self._pages.values())
+        )
+        pages = self._random.sample(rows, min(count, len(rows)))
+        now = isoformat(datetime.now(timezone.utc))
+        for page in pages:
+            self._edits += 1
+            title = f"Synthetic page edit {self._edits}"
+            title_property = page["properties"]["Name"]["title"][0]
+            title_property["plain_text"] = title
+            title_property["text"]["content"] = title
+            page["last_edited_time"] = now
+            page["last_edited_by"] = {
+                "object": "user",
+                "id": self._random.choice(list(self._users)),
+            }
+            self._index(page)
+        self._views.clear()
+        return [page["id"] for page in pages]
+
+    def create_pages(self, count: int, database_id: str) -> List[str]:
+        """Add ``count`` pages created now to a database, returning their IDs"""
+        database_id = normalize_notion_id(database_id)
+        rows = self._databases[database_id]
+        now = datetime.now(timezone.utc)
+        created = []
+        for index in range(len(rows), len(rows) + count):
+            page = make_page(
+                index,
+                user_count=len(self._users),
+                edited_time=now,
+                database_id=database_id,
+            )
+            page["created_time"] = isoformat(now)
+            rows.append(page)
+            self._index(page)
+            created.append(page["id"])
+        self._views.clear()
+        return created
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call counts per endpoint and the number of injected 429s"""
+        return {
+            "calls": dict(self.calls),
+            "rate_limited": self.rate_limited,
+            "pages_served": self.pages_served,
+        }
+
+    async def _request(self, endpoint: str) -> None:
+        """Simulate the round trip and rate limiting of one API call"""
+        self.calls[endpoint] += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+            self.rate_limited += 1
+            raise FakeNotionAPIError(
+                429,
+                "rate_limited",
+                "You have been rate limited. Please try again in a few minutes.",
+                retry_after=self.retry_after,
+            )
+
+    def _index(self, page: dict) -> None:
+        self._pages[page["id"]] = page
+        self._times[page["id"]] = {
+            "created_time": _parse_time(page["created_time"]),
+            "last_edited_time": _parse_time(page["last_edited_time"]),
+        }
+
+    def _view(
+        self,
+        database_id: str,
+        query_filter: Optional[dict],
+        sorts: Optional[List[dict]],
+    ) -> Tuple[List[dict], Dict[str, int]]:
+        """Get a database's filtered and sorted rows, cached until the next edit"""
+        database_id = normalize_notion_id(database_id)
+        if database_id not in self._databases:
+            raise FakeNotionAPIError(
+                404,
+                "object_not_found",
+                f"Could not find database with ID: {database_id}",
+            )
+
+        key = repr((database_id, query_filter, sorts))
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        rows = self._databases[database_id]
+        if query_filter:
+            matches = self._compile(query_filter)
+            rows = [row for row in rows if matches(row)]
+        # Stable sorts applied last-to-first give the API's multi-key ordering
+        for sort in reversed(sorts or []):
+            timestamp = sort.get("timestamp")
+            if timestamp not in ("created_time", "last_edited_time"):
+                raise FakeNotionAPIError(
+                    400, "validation_error", f"Unsupported sort: {sort}"
+                )
+            rows = sorted(
+                rows,
+                key=lambda row: self._times[row["id"]][timestamp],
+                reverse=sort.get("direction") == "descending",
+            )
+
+        view = (rows, {row["id"]: position for position, row in enumerate(rows)})
+        self._views[key] = view
+        return view
+
+    def _compile(self, query_filter: dict) -> Callable[[dict], bool]:
+        """Turn a timestamp filter, or an ``and``/``or`` of them, into a predicate"""
+        if "and" in query_filter:
+            parts = [self._compile(part) for part in query_filter["and"]]
+            return lambda row: all(part(row) for part in parts)
+        if "or" in query_filter:
+            parts = [self._compile(part) for part in query_filter["or"]]
+            return lambda row: any(part(row) for part in parts)
+
+        timestamp = query_filter.get("timestamp")
+        if timestamp not in ("created_time", "last_edited_time"):
+            raise FakeNotionAPIError(
+                400, "validation_error", f"Unsupported filter: {query_filter}"
+            )
+        conditions = [
+            (TIMESTAMP_OPERATORS[operator], _parse_time(bound))
+            for operator, bound in query_filter[timestamp].items()
+        ]
+        return lambda row: all(
+            compare(self._times[row["id"]][timestamp], bound)
+            for compare, bound in conditions
+        )
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+from sqlalchemy import inspect, select, text, update
+from sqlalchemy.orm import sessionmaker, Session
+from src.domain.notion.repositories import NotionQueries
+from src.infrastructure.config.database import engine
+from src.infrastructure.database.models import (
+    Base,
+    NotionDocumentModel,
+    NotionDocumentVersionModel,
+    NotionStateModel,
+)
+from src.infrastructure.config.constants import (
+    MAX_LOOKUP_BATCH_SIZE,
+    SYNC_TYPE_UPDATES,
+)
+from src.infrastructure.config.settings import load_environment
+from src.utils.notion_utils import compute_content_hash, normalize_notion_id
+from src.utils.logging import logger
+
+
+def add_missing_columns():
+    """Create new tables, then add columns and indexes missing from existing ones"""
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                logger.info(f"Adding column {table.name}.{column.name}")
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table.name} "
+                        f"ADD COLUMN {column.name} {column_type}"
+                    )
+                )
+
+            existing_indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    logger.info(f"Creating index {index.name}")
+                    index.create(conn)
+
+
+def backfill_content_hashes():
+    """Compute content hashes for rows stored before the column existed
+
+    Delta-encoded versions hold no properties of their own, so theirs are
+    rebuilt from the nearest keyframe before hashing.
+    """
+    session_factory = sessionmaker(engine, class_=Session, expire_on_commit=False)
+
+    for model in (NotionDocumentModel, NotionDocumentVersionModel):
+        is_version = model is NotionDocumentVersionModel
+        columns = [model.id, model.title, model.properties, model.archived]
+        if is_version:
+            columns += [model.document_id, model.sequence, model.is_keyframe]
+
+        total = 0
+        last_id = ""
+        while True:
+            with session_factory() as session:
+                # Page by ID so rows that cannot be rebuilt are not read again
+                rows = session.execute(
+                    select(*columns)
+                    .where(model.content_hash.is_(None), model.id > last_id)
+                    .order_by(model.id)
+                    .limit(MAX_LOOKUP_BATCH_SIZE)
+                ).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+
+                for row in rows:
+                    properties = row.properties
+                    if is_version and row.is_keyframe is False:
+                        version = NotionQueries.get_document_version(
+                            session, row.document_id, row.sequence
+                        )
+                        if version is None:
+                            logger.warning(
+                                f"Could not rebuild version {row.id}, "
+                                "leaving its content hash empty"
+                            )
+                            continue
+                        properties = version.properties
+
+                    session.execute(
+                        update(model)
+                        .where(model.id == row.id)
+                        .values(
+                            content_hash=compute_content_hash(
+                                row.title, properties, row.archived
+                            )
+                        )
+                    )
+                    total += 1
+                session.commit()
+
+        logger.info(f"Backfilled content hashes for {total} {model.__tablename__}")
+
+
+def partition_legacy_state():
+    """Assign single-database rows and watermark to NOTION_DATABASE_ID"""
+    database_id = load_environment().NOTION_DATABASE_ID
+    if not database_id:
+        logger.info("NOTION_DATABASE_ID is not set, skipping database partitioning")
+        return
+    database_id = normalize_notion_id(database_id)
+
+    with engine.begin() as conn:
+        result = conn.execute(
+            update(NotionDocumentModel)
+            .where(NotionDocumentModel.database_id.is_(None))
+            .values(database_id=database_id)
+        )
+        logger.info(f"Assigned {result.rowcount} documents to database {database_id}")
+
+        conn.execute(
+            update(NotionStateModel)
+            .where(NotionStateModel.sync_type == SYNC_TYPE_UPDATES)
+            .values(sync_type=f"{SYNC_TYPE_UPDATES}:{database_id}")
+        )
+
+
+def migrate_schema():
+    """Bring an existing database up to the current models"""
+    logger.info("Migrating database schema")
+    add_missing_columns()
+    backfill_content_hashes()
+    partition_legacy_state()
+    engine.dispose()
+    logger.info("Database schema migrated successfully")
+
+
+if __name__ == "__main__":
+    migrate_schema()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Sign and POST Notion webhook payloads to a running bot.
+
+Replays recorded payload files, or builds a minimal event from the command
+line, against NOTION_WEBHOOK_URL using NOTION_WEBHOOK_SECRET to sign them:
+
+    python -m src.scripts.post_webhook recorded_event.json
+    python -m src.scripts.post_webhook page.content_updated <page_id> [<database_id>]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+import aiohttp
+from src.infrastructure.config.constants import (
+    WEBHOOK_PATH,
+    WEBHOOK_PORT,
+    WEBHOOK_SIGNATURE_HEADER,
+)
+from src.infrastructure.notion_webhook.server import sign_payload
+
+
+def make_event(
+    event_type: str, page_id: str, database_id: Optional[str] = None
+) -> dict:
+    """Build a webhook payload shaped like the ones Notion delivers"""
+    payload = {
+        "id": str(uuid.uuid4()),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "type": event_type,
+        "entity": {"id": page_id, "type": "page"},
+        "data": {},
+    }
+    if database_id:
+        payload["data"]["parent"] = {"id": database_id, "type": "database"}
+    return payload
+
+
+async def post_payloads(url: str, secret: str, payloads: List[dict]) -> None:
+    """POST each payload with a valid signature and print the response"""
+    async with aiohttp.ClientSession() as session:
+        for payload in payloads:
+            body = json.dumps(payload).encode()
+            headers = {
+                "Content-Type": "application/json",
+                WEBHOOK_SIGNATURE_HEADER: sign_payload(body, secret),
+            }
+            async with session.post(url, data=body, headers=headers) as response:
+                print(f"{payload.get('type')}: {response.status}")
+
+
+def load_payloads(args: List[str]) -> List[dict]:
+    """Read payload files, or build one event from ``type page_id [database_id]``"""
+    if args and args[0].endswith(".json"):
+        payloads = []
+        for path in args:
+            with open(path) as f:
+                data = json.load(f)
+            payloads.extend(data if isinstance(data, list) else [data])
+        return payloads
+    if len(args) in (2, 3):
+        return [make_event(*args)]
+    sys.exit(__doc__)
+
+
+if __name__ == "__main__":
+    secret = os.getenv("NOTION_WEBHOOK_SECRET")
+    if not secret:
+        sys.exit("NOTION_WEBHOOK_SECRET is required to sign payloads")
+
+    asyncio.run(
+        post_payloads(
+            os.getenv(
+                "NOTION_WEBHOOK_URL", f"http://localhost:{WEBHOOK_PORT}{WEBHOOK_PATH}"
+            ),
+            secret,
+            load_payloads(sys.argv[1:]),
+        )
+    )
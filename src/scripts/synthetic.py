@@ -0,0 +1,101 @@
+"""Synthetic Notion API payloads for benchmarks and load tests."""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def isoformat(value: datetime) -> str:
+    """Format a timestamp the way the Notion API does"""
+    return value.strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+def make_user_id(index: int) -> str:
+    """Build a stable user ID for a synthetic workspace member"""
+    return str(uuid.UUID(int=index + 1))
+
+
+def make_user(index: int) -> dict:
+    """Build a ``users.retrieve`` result for a synthetic workspace member"""
+    return {
+        "object": "user",
+        "id": make_user_id(index),
+        "type": "person",
+        "name": f"Synthetic user {index}",
+        "avatar_url": None,
+        "person": {"email": f"user{index}@example.com"},
+    }
+
+
+def make_page(
+    index: int,
+    user_count: int = 20,
+    edited_time: Optional[datetime] = None,
+    title: Optional[str] = None,
+    database_id: Optional[str] = None,
+) -> dict:
+    """Build a database page shaped like a ``databases.query`` result row
+
+    Pages of different ``database_id``s get distinct IDs for the same index.
+    """
+    created_time = BASE_TIME + timedelta(minutes=index)
+    edited_time = edited_time or created_time + timedelta(hours=1)
+    if database_id:
+        page_id = str(uuid.uuid5(uuid.UUID(database_id), str(index)))
+    else:
+        page_id = str(uuid.UUID(int=(1 << 64) + index))
+    title = title or f"Synthetic page {index}"
+
+    page = {
+        "object": "page",
+        "id": page_id,
+        "created_time": isoformat(created_time),
+        "last_edited_time": isoformat(edited_time),
+        "created_by": {"object": "user", "id": make_user_id(index % user_count)},
+        "last_edited_by": {
+            "object": "user",
+            "id": make_user_id((index * 7) % user_count),
+        },
+        "archived": False,
+        "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+        "properties": {
+            "Status": {
+                "id": "status",
+                "type": "select",
+                "select": {"name": random.choice(["Todo", "Doing", "Done"])},
+            },
+            "Done": {"id": "done", "type": "checkbox", "checkbox": index % 2 == 0},
+            "Name": {
+                "id": "title",
+                "type": "title",
+                "title": [
+                    {
+                        "type": "text",
+                        "text": {"content": title, "link": None},
+                        "plain_text": title,
+                        "href": None,
+                    }
+                ],
+            },
+        },
+    }
+    if database_id:
+        page["parent"] = {"type": "database_id", "database_id": database_id}
+    return page
+
+
+def make_pages(
+    count: int,
+    user_count: int = 20,
+    seed: int = 0,
+    database_id: Optional[str] = None,
+) -> List[dict]:
+    """Build ``count`` synthetic pages with deterministic content"""
+    random.seed(seed)
+    return [
+        make_page(index, user_count=user_count, database_id=database_id)
+        for index in range(count)
+    ]
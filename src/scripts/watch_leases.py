@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Run a lease coordinator on its own to check failover between replicas.
+
+Start two copies against the same database (DATABASE_URL, which may be a
+SQLite file) and watch the databases move between them as one is stopped
+and restarted. No Notion or Discord credentials are needed.
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, Session
+from src.application.notion.coordinator import LeaseCoordinator
+from src.domain.notion.repositories import (
+    SQLNotionRepository,
+    ThreadedNotionRepository,
+)
+from src.infrastructure.config.constants import COORDINATION_SHARD, LEASE_TTL
+from src.infrastructure.config.database import get_database_url
+from src.infrastructure.config.settings import WatchedDatabase
+from src.infrastructure.database.models import Base
+
+
+async def watch_leases(
+    database_url: str, mode: str, lease_ttl: int, database_count: int
+) -> None:
+    """Renew leases every third of the lease interval and print ownership"""
+    engine = create_engine(
+        database_url.replace("postgres://", "postgresql+psycopg2://", 1)
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(engine, class_=Session, expire_on_commit=False)
+    databases = [
+        WatchedDatabase(database_id=str(uuid.UUID(int=index + 1)), channels=[])
+        for index in range(database_count)
+    ]
+    coordinator = LeaseCoordinator(
+        ThreadedNotionRepository(SQLNotionRepository(session_factory)),
+        databases,
+        mode=mode,
+        lease_ttl=lease_ttl,
+    )
+
+    print(f"Replica {coordinator.holder} ({mode}, {lease_ttl}s leases)")
+    try:
+        while True:
+            await coordinator.renew()
+            owned = sorted(database_id[-4:] for database_id in coordinator.owned)
+            print(
+                f"{datetime.now(timezone.utc):%H:%M:%S} "
+                f"leader={coordinator.is_leader} databases={owned}"
+            )
+            await asyncio.sleep(max(lease_ttl / 3, 1))
+    finally:
+        await coordinator.release()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(
+            watch_leases(
+                get_database_url(),
+                os.getenv("COORDINATION_MODE", COORDINATION_SHARD),
+                int(os.getenv("LEASE_TTL", LEASE_TTL)),
+                int(os.getenv("COORDINATION_DATABASES", "4")),
+            )
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,62 @@
+import copy
+from typing import Any, List
+
+
+def _escape(key: str) -> str:
+    """Escape an object key as a JSON Pointer reference token"""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """Decode a JSON Pointer reference token"""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[dict]:
+    """Build a JSON Patch (RFC 6902) turning ``old`` into ``new``
+
+    Objects are diffed key by key; any other value, including arrays, is
+    replaced as a whole.
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        if old == new:
+            return []
+        return [{"op": "replace", "path": path, "value": new}]
+
+    patch = []
+    for key in old:
+        if key not in new:
+            patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+
+    for key, value in new.items():
+        child_path = f"{path}/{_escape(key)}"
+        if key not in old:
+            patch.append({"op": "add", "path": child_path, "value": value})
+        elif old[key] != value:
+            patch.extend(make_patch(old[key], value, child_path))
+
+    return patch
+
+
+def apply_patch(document: Any, patch: List[dict]) -> Any:
+    """Apply a patch produced by ``make_patch`` and return the new document"""
+    result = copy.deepcopy(document)
+
+    for operation in patch:
+        tokens = [_unescape(t) for t in operation["path"].split("/")[1:]]
+        if not tokens:
+            result = copy.deepcopy(operation["value"])
+            continue
+
+        parent = result
+        for token in tokens[:-1]:
+            parent = parent[token]
+
+        if operation["op"] == "remove":
+            del parent[tokens[-1]]
+        elif operation["op"] in ("add", "replace"):
+            parent[tokens[-1]] = copy.deepcopy(operation["value"])
+        else:
+            raise ValueError(f"Unsupported patch operation: {operation['op']}")
+
+    return result
@@ -1,3 +1,9 @@
+import hashlib
+import json
+import uuid
+from datetime import datetime, timezone
+
+
 def extract_title(page: dict) -> str:
     """Extract clean title from page data"""
     if "properties" in page:
@@ -20,3 +26,55 @@ def extract_title(page: dict) -> str:
                 return title
 
     return "Untitled Document"
+
+
+def parse_notion_time(value: str) -> datetime:
+    """Parse a timestamp as the Notion API formats it"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def format_notion_time(value: datetime) -> str:
+    """Format a timestamp the way the Notion API does, to the millisecond"""
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def normalize_notion_id(notion_id: str) -> str:
+    """Normalize a Notion ID to the hyphenated form the API returns"""
+    try:
+        return str(uuid.UUID(notion_id))
+    except (TypeError, ValueError):
+        return notion_id
+
+
+def encode_properties(properties: dict) -> bytes:
+    """Serialize page properties to canonical, compact JSON"""
+    return json.dumps(
+        properties or {},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+
+
+def compute_content_hash(title: str, properties: dict, archived: bool) -> str:
+    """Compute a canonical hash of the user-visible content of a page"""
+    return hash_encoded_content(title, encode_properties(properties), archived)
+
+
+def hash_encoded_content(title: str, properties_json: bytes, archived: bool) -> str:
+    """Compute the content hash from properties already serialized canonically"""
+    # Same bytes as dumping {"archived", "properties", "title"} with sorted keys
+    payload = b"".join(
+        (
+            b'{"archived":',
+            b"true" if archived else b"false",
+            b',"properties":',
+            properties_json,
+            b',"title":',
+            json.dumps(title, ensure_ascii=False).encode("utf-8"),
+            b"}",
+        )
+    )
+    return hashlib.sha256(payload).hexdigest()
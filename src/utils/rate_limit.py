@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def time_until_token(self) -> float:
+        """Refill the bucket and return how long until a token is free"""
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def take(self) -> None:
+        """Consume one token; callers check ``time_until_token`` first"""
+        self._tokens -= 1
+
+    async def acquire(self) -> None:
+        """Wait until a token is free and consume it"""
+        while True:
+            delay = self.time_until_token()
+            if delay <= 0:
+                self.take()
+                return
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a while"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left on the current pause"""
+        return max(0.0, self._paused_until - time.monotonic())